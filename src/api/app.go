@@ -31,6 +31,7 @@ func Run(ctx context.Context) error {
 	}
 
 	catalog := services.NewCatalogService(pool)
+	go catalog.WarmUpstreamConnections(ctx)
 	var modelUpdates *config.ModelUpdatesConfig
 	var resolvedModelConfigPath string
 	if resolved, resolveErr := config.ResolveModelConfigPath(cfg.ModelConfigPath); resolveErr == nil {
@@ -68,6 +69,10 @@ func Run(ctx context.Context) error {
 	if err := server.ListenAndServe(); err != nil && err != http.ErrServerClosed {
 		return err
 	}
+
+	flushCtx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
+	defer cancel()
+	catalog.FlushUsage(flushCtx)
 	return nil
 }
 
@@ -17,6 +17,9 @@ type authContextData struct {
 	APIKey   schemas.APIKey
 	Policy   services.APIKeyPolicy
 	AuthType string
+	// Limits is the policy's parameter_limits pre-compiled once at auth time
+	// so the per-request payload pass skips absent or non-numeric entries.
+	Limits []compiledParameterLimit
 }
 
 type authContextKeyType string
@@ -110,17 +113,35 @@ func extractProviderModel(providerHint string, model string) (string, string) {
 	return provider, name
 }
 
-func applyParameterLimits(payload map[string]any, limits map[string]any) {
-	if payload == nil || limits == nil {
-		return
+var limitedParameterKeys = []string{"max_tokens", "temperature", "top_p", "frequency_penalty", "presence_penalty"}
+
+type compiledParameterLimit struct {
+	key   string
+	limit float64
+}
+
+// compileParameterLimits extracts the numeric caps from a parameter_limits map
+// once, so request handling iterates only over limits that actually exist.
+func compileParameterLimits(limits map[string]any) []compiledParameterLimit {
+	if len(limits) == 0 {
+		return nil
 	}
-	for _, key := range []string{"max_tokens", "temperature", "top_p", "frequency_penalty", "presence_penalty"} {
-		limit, ok := numericValue(limits[key])
-		if !ok {
-			continue
+	out := make([]compiledParameterLimit, 0, len(limitedParameterKeys))
+	for _, key := range limitedParameterKeys {
+		if limit, ok := numericValue(limits[key]); ok {
+			out = append(out, compiledParameterLimit{key: key, limit: limit})
 		}
-		if current, hasCurrent := numericValue(payload[key]); hasCurrent && current > limit {
-			payload[key] = preserveType(payload[key], limit)
+	}
+	return out
+}
+
+func applyParameterLimits(payload map[string]any, limits []compiledParameterLimit) {
+	if payload == nil {
+		return
+	}
+	for _, item := range limits {
+		if current, hasCurrent := numericValue(payload[item.key]); hasCurrent && current > item.limit {
+			payload[item.key] = preserveType(payload[item.key], item.limit)
 		}
 	}
 }
@@ -1,8 +1,10 @@
 package api
 
 import (
+	"bytes"
 	"encoding/base64"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"io"
 	"net/http"
@@ -108,18 +110,22 @@ func readJSONBody(r *http.Request, allowEmpty bool) (map[string]any, error) {
 	if err != nil {
 		return nil, fmt.Errorf("read request body: %w", err)
 	}
-	if len(strings.TrimSpace(string(raw))) == 0 {
+	if len(bytes.TrimSpace(raw)) == 0 {
 		if allowEmpty {
 			return map[string]any{}, nil
 		}
 		return nil, fmt.Errorf("request body cannot be empty")
 	}
-	var payload any
-	if err := json.Unmarshal(raw, &payload); err != nil {
+	var obj map[string]any
+	if err := json.Unmarshal(raw, &obj); err != nil {
+		var typeErr *json.UnmarshalTypeError
+		if errors.As(err, &typeErr) && typeErr.Field == "" {
+			return nil, fmt.Errorf("request body must be a json object")
+		}
 		return nil, fmt.Errorf("invalid json body: %w", err)
 	}
-	obj, ok := payload.(map[string]any)
-	if !ok {
+	if obj == nil {
+		// A literal `null` body unmarshals into a nil map without error.
 		return nil, fmt.Errorf("request body must be a json object")
 	}
 	return obj, nil
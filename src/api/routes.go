@@ -10,9 +10,12 @@ import (
 	"errors"
 	"fmt"
 	"io"
+	"math/rand/v2"
 	"mime/multipart"
 	"net"
 	"net/http"
+	"net/url"
+	"strconv"
 	"strings"
 	"sync"
 	"time"
@@ -23,13 +26,25 @@ import (
 	"github.com/rinbarpen/llm-router/src/services"
 )
 
-const streamOpenRetryAttempts = 2
+const streamOpenRetryAttempts = 3
 
 var (
-	streamOpenRetryBackoff = 120 * time.Millisecond
-	streamIdleTimeout      = 45 * time.Second
+	streamOpenRetryBackoff    = 120 * time.Millisecond
+	streamOpenRetryBackoffCap = 2 * time.Second
+	streamIdleTimeout         = 45 * time.Second
 )
 
+// streamOpenRetryDelay doubles the base backoff per attempt (capped) and adds
+// up to 50% random jitter so concurrent clients do not retry in lockstep
+// against a recovering upstream.
+func streamOpenRetryDelay(attempt int) time.Duration {
+	delay := streamOpenRetryBackoff << attempt
+	if delay > streamOpenRetryBackoffCap {
+		delay = streamOpenRetryBackoffCap
+	}
+	return delay + time.Duration(rand.Int64N(int64(delay)/2+1))
+}
+
 type CatalogService interface {
 	ListProviders(ctx context.Context) ([]schemas.Provider, error)
 	GetProviderByName(ctx context.Context, name string) (schemas.Provider, error)
@@ -86,6 +101,16 @@ type CatalogService interface {
 	RunSelfCheck(ctx context.Context) (map[string]any, error)
 }
 
+// Optional CatalogService capabilities used on hot request paths; asserted
+// once at router construction instead of per request.
+type apiKeyQuotaChecker interface {
+	CheckAPIKeyQuota(ctx context.Context, apiKeyID int64, quotaTokensMonthly int64) error
+}
+
+type invocationQueryService interface {
+	QueryInvocations(ctx context.Context, opts services.InvocationQueryOptions) ([]schemas.MonitorInvocation, error)
+}
+
 type RouterOptions struct {
 	RequireAuth         bool
 	AllowLocalNoAuth    bool
@@ -122,6 +147,8 @@ func apiCompatSubrouter(svc CatalogService, sessionStore SessionStore, opts Rout
 }
 
 func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore, opts RouterOptions) {
+	quotaChecker, hasQuotaChecker := svc.(apiKeyQuotaChecker)
+	querySvc, hasQuerySvc := svc.(invocationQueryService)
 	if opts.RequireAuth {
 		r.Use(authMiddleware(svc, sessions, opts))
 	}
@@ -143,6 +170,18 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
+		if vs, ok := svc.(interface {
+			ProviderListVersion(ctx context.Context) (int64, *time.Time, error)
+		}); ok {
+			if count, updated, err := vs.ProviderListVersion(req.Context()); err == nil {
+				etag := weakListETag(count, updated)
+				if req.Header.Get("If-None-Match") == etag {
+					w.WriteHeader(http.StatusNotModified)
+					return
+				}
+				w.Header().Set("ETag", etag)
+			}
+		}
 		providers, err := svc.ListProviders(req.Context())
 		if err != nil {
 			writeJSONError(w, http.StatusInternalServerError, "list providers failed")
@@ -202,6 +241,18 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
+		if vs, ok := svc.(interface {
+			ModelListVersion(ctx context.Context) (int64, *time.Time, error)
+		}); ok {
+			if count, updated, err := vs.ModelListVersion(req.Context()); err == nil {
+				etag := weakListETag(count, updated)
+				if req.Header.Get("If-None-Match") == etag {
+					w.WriteHeader(http.StatusNotModified)
+					return
+				}
+				w.Header().Set("ETag", etag)
+			}
+		}
 		models, err := svc.ListModels(req.Context())
 		if err != nil {
 			writeJSONError(w, http.StatusInternalServerError, "list models failed")
@@ -461,11 +512,12 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		writeJSON(w, http.StatusCreated, item)
 	})
 	r.Get("/api-keys", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
-		includeInactive := req.URL.Query().Get("include_inactive") == "true"
+		includeInactive := q.Get("include_inactive") == "true"
 		items, err := svc.ListAPIKeys(req.Context(), includeInactive)
 		if err != nil {
 			writeJSONError(w, http.StatusInternalServerError, "list api keys failed")
@@ -542,6 +594,7 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		w.WriteHeader(http.StatusNoContent)
 	})
 	r.Get("/api-key-policy-templates", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		ts, ok := svc.(interface {
 			ListAPIKeyPolicyTemplates(ctx context.Context, teamTag, envTag string) ([]map[string]any, error)
 		})
@@ -549,8 +602,8 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 			writeJSONError(w, http.StatusNotImplemented, "policy template not supported")
 			return
 		}
-		teamTag := strings.TrimSpace(req.URL.Query().Get("team_tag"))
-		envTag := strings.TrimSpace(req.URL.Query().Get("env_tag"))
+		teamTag := strings.TrimSpace(q.Get("team_tag"))
+		envTag := strings.TrimSpace(q.Get("env_tag"))
 		out, err := ts.ListAPIKeyPolicyTemplates(req.Context(), teamTag, envTag)
 		if err != nil {
 			writeJSONError(w, http.StatusInternalServerError, "list policy templates failed")
@@ -687,6 +740,7 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		writeJSON(w, http.StatusOK, out)
 	})
 	r.Get("/api-keys/policy-audit", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		ts, ok := svc.(interface {
 			ListAPIKeyPolicyAudit(ctx context.Context, limit int, offset int) ([]map[string]any, error)
 		})
@@ -694,8 +748,8 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 			writeJSONError(w, http.StatusNotImplemented, "policy audit not supported")
 			return
 		}
-		limit := parseIntQuery(req, "limit", 100)
-		offset := parseIntQuery(req, "offset", 0)
+		limit := parseIntQuery(q, "limit", 100)
+		offset := parseIntQuery(q, "offset", 0)
 		out, err := ts.ListAPIKeyPolicyAudit(req.Context(), limit, offset)
 		if err != nil {
 			writeJSONError(w, http.StatusInternalServerError, "list policy audit failed")
@@ -730,14 +784,10 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 			writeJSONError(w, http.StatusForbidden, "请求来源 IP 不在允许范围内。")
 			return
 		}
-		if item.QuotaTokensMonth != nil {
-			if checker, ok := svc.(interface {
-				CheckAPIKeyQuota(ctx context.Context, apiKeyID int64, quotaTokensMonthly int64) error
-			}); ok {
-				if err := checker.CheckAPIKeyQuota(req.Context(), item.ID, *item.QuotaTokensMonth); err != nil {
-					writeJSONError(w, http.StatusForbidden, "API Key 月度配额已用尽。")
-					return
-				}
+		if item.QuotaTokensMonth != nil && hasQuotaChecker {
+			if err := quotaChecker.CheckAPIKeyQuota(req.Context(), item.ID, *item.QuotaTokensMonth); err != nil {
+				writeJSONError(w, http.StatusForbidden, "API Key 月度配额已用尽。")
+				return
 			}
 		}
 		sessionData, err := sessions.Create(item.ID)
@@ -745,10 +795,10 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 			writeJSONError(w, http.StatusInternalServerError, "create session failed")
 			return
 		}
-		writeJSON(w, http.StatusOK, map[string]any{
-			"session_token": sessionData.Token,
-			"api_key_id":    item.ID,
-			"message":       "登录成功，请使用此 token 进行后续请求。使用 /auth/bind-model 绑定模型。",
+		writeJSON(w, http.StatusOK, schemas.LoginResponse{
+			SessionToken: sessionData.Token,
+			APIKeyID:     item.ID,
+			Message:      "登录成功，请使用此 token 进行后续请求。使用 /auth/bind-model 绑定模型。",
 		})
 	})
 	r.Post("/auth/bind-model", func(w http.ResponseWriter, req *http.Request) {
@@ -796,16 +846,17 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		})
 	})
 	r.Get("/auth/oauth/{provider}/authorize", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
 		providerType := strings.ToLower(strings.TrimSpace(chi.URLParam(req, "provider")))
-		providerName := strings.TrimSpace(req.URL.Query().Get("provider_name"))
+		providerName := strings.TrimSpace(q.Get("provider_name"))
 		if providerName == "" {
 			providerName = providerType
 		}
-		callbackURL := strings.TrimSpace(req.URL.Query().Get("callback_url"))
+		callbackURL := strings.TrimSpace(q.Get("callback_url"))
 		if callbackURL == "" || callbackURL == "/" {
 			scheme := "http"
 			if req.TLS != nil {
@@ -818,8 +869,8 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 			scheme = "https"
 		}
 		backendBaseURL := scheme + "://" + req.Host
-		accountName := strings.TrimSpace(req.URL.Query().Get("account_name"))
-		setDefault := strings.EqualFold(strings.TrimSpace(req.URL.Query().Get("set_default")), "true")
+		accountName := strings.TrimSpace(q.Get("account_name"))
+		setDefault := strings.EqualFold(strings.TrimSpace(q.Get("set_default")), "true")
 		url, state, err := svc.OAuthAuthorizeURL(req.Context(), providerType, providerName, callbackURL, backendBaseURL, accountName, setDefault)
 		if err != nil {
 			writeJSONError(w, http.StatusBadRequest, err.Error())
@@ -828,13 +879,14 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		writeJSON(w, http.StatusOK, map[string]any{"url": url, "state": state})
 	})
 	r.Get("/auth/oauth/{provider}/callback", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
 		providerType := strings.ToLower(strings.TrimSpace(chi.URLParam(req, "provider")))
-		code := strings.TrimSpace(req.URL.Query().Get("code"))
-		state := strings.TrimSpace(req.URL.Query().Get("state"))
+		code := strings.TrimSpace(q.Get("code"))
+		state := strings.TrimSpace(q.Get("state"))
 		if code == "" || state == "" {
 			writeJSONError(w, http.StatusBadRequest, "missing code or state")
 			return
@@ -851,11 +903,12 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		http.Redirect(w, req, redirectURL, http.StatusFound)
 	})
 	r.Get("/auth/oauth/{provider}/status", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
-		providerName := strings.TrimSpace(req.URL.Query().Get("provider_name"))
+		providerName := strings.TrimSpace(q.Get("provider_name"))
 		if providerName == "" {
 			providerName = strings.ToLower(strings.TrimSpace(chi.URLParam(req, "provider")))
 		}
@@ -870,11 +923,12 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		})
 	})
 	r.Get("/auth/oauth/{provider}/accounts", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
-		providerName := strings.TrimSpace(req.URL.Query().Get("provider_name"))
+		providerName := strings.TrimSpace(q.Get("provider_name"))
 		if providerName == "" {
 			providerName = strings.ToLower(strings.TrimSpace(chi.URLParam(req, "provider")))
 		}
@@ -889,11 +943,12 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		})
 	})
 	r.Patch("/auth/oauth/{provider}/accounts/{account_id}", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
-		providerName := strings.TrimSpace(req.URL.Query().Get("provider_name"))
+		providerName := strings.TrimSpace(q.Get("provider_name"))
 		if providerName == "" {
 			providerName = strings.ToLower(strings.TrimSpace(chi.URLParam(req, "provider")))
 		}
@@ -919,11 +974,12 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		writeJSON(w, http.StatusOK, item)
 	})
 	r.Post("/auth/oauth/{provider}/accounts/{account_id}/default", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
-		providerName := strings.TrimSpace(req.URL.Query().Get("provider_name"))
+		providerName := strings.TrimSpace(q.Get("provider_name"))
 		if providerName == "" {
 			providerName = strings.ToLower(strings.TrimSpace(chi.URLParam(req, "provider")))
 		}
@@ -944,11 +1000,12 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		writeJSON(w, http.StatusOK, item)
 	})
 	r.Delete("/auth/oauth/{provider}/accounts/{account_id}", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
-		providerName := strings.TrimSpace(req.URL.Query().Get("provider_name"))
+		providerName := strings.TrimSpace(q.Get("provider_name"))
 		if providerName == "" {
 			providerName = strings.ToLower(strings.TrimSpace(chi.URLParam(req, "provider")))
 		}
@@ -1307,53 +1364,44 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		writeJSON(w, http.StatusOK, out)
 	})
 	r.Get("/monitor/invocations", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
-		limit := parseIntQuery(req, "limit", 50)
-		offset := parseIntQuery(req, "offset", 0)
-		if querySvc, ok := svc.(interface {
-			QueryInvocations(ctx context.Context, opts services.InvocationQueryOptions) ([]schemas.MonitorInvocation, error)
-		}); ok {
+		limit := parseIntQuery(q, "limit", 50)
+		offset := parseIntQuery(q, "offset", 0)
+		if hasQuerySvc {
 			opts := services.InvocationQueryOptions{
 				Limit:        limit,
 				Offset:       offset,
-				ModelName:    strings.TrimSpace(req.URL.Query().Get("model_name")),
-				ProviderName: strings.TrimSpace(req.URL.Query().Get("provider_name")),
-				Status:       strings.TrimSpace(req.URL.Query().Get("status")),
-				AuthType:     strings.TrimSpace(req.URL.Query().Get("auth_type")),
-				OrderBy:      strings.TrimSpace(req.URL.Query().Get("order_by")),
-				OrderDesc:    strings.ToLower(strings.TrimSpace(req.URL.Query().Get("order_desc"))) != "false",
-			}
-			if raw := strings.TrimSpace(req.URL.Query().Get("model_id")); raw != "" {
+				ModelName:    strings.TrimSpace(q.Get("model_name")),
+				ProviderName: strings.TrimSpace(q.Get("provider_name")),
+				Status:       strings.TrimSpace(q.Get("status")),
+				AuthType:     strings.TrimSpace(q.Get("auth_type")),
+				OrderBy:      strings.TrimSpace(q.Get("order_by")),
+				OrderDesc:    strings.ToLower(strings.TrimSpace(q.Get("order_desc"))) != "false",
+			}
+			if raw := strings.TrimSpace(q.Get("model_id")); raw != "" {
 				var id int64
 				if _, err := fmt.Sscanf(raw, "%d", &id); err == nil && id > 0 {
 					opts.ModelID = &id
 				}
 			}
-			if raw := strings.TrimSpace(req.URL.Query().Get("provider_id")); raw != "" {
+			if raw := strings.TrimSpace(q.Get("provider_id")); raw != "" {
 				var id int64
 				if _, err := fmt.Sscanf(raw, "%d", &id); err == nil && id > 0 {
 					opts.ProviderID = &id
 				}
 			}
-			if raw := strings.TrimSpace(req.URL.Query().Get("api_key_id")); raw != "" {
+			if raw := strings.TrimSpace(q.Get("api_key_id")); raw != "" {
 				var id int64
 				if _, err := fmt.Sscanf(raw, "%d", &id); err == nil && id > 0 {
 					opts.APIKeyID = &id
 				}
 			}
-			if raw := strings.TrimSpace(req.URL.Query().Get("start_time")); raw != "" {
-				if ts, err := time.Parse(time.RFC3339, raw); err == nil {
-					opts.StartTime = &ts
-				}
-			}
-			if raw := strings.TrimSpace(req.URL.Query().Get("end_time")); raw != "" {
-				if ts, err := time.Parse(time.RFC3339, raw); err == nil {
-					opts.EndTime = &ts
-				}
-			}
+			opts.StartTime = parseTimeQuery(q, "start_time")
+			opts.EndTime = parseTimeQuery(q, "end_time")
 			out, err := querySvc.QueryInvocations(req.Context(), opts)
 			if err != nil {
 				writeJSONError(w, http.StatusInternalServerError, "list monitor invocations failed")
@@ -1391,15 +1439,16 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		writeJSON(w, http.StatusOK, out)
 	})
 	r.Get("/monitor/login-records", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
-		limit := parseIntQuery(req, "limit", 100)
+		limit := parseIntQuery(q, "limit", 100)
 		if limit > 500 {
 			limit = 500
 		}
-		offset := parseIntQuery(req, "offset", 0)
+		offset := parseIntQuery(q, "offset", 0)
 		out, total, err := svc.ListLoginRecords(req.Context(), limit, offset)
 		if err != nil {
 			writeJSON(w, http.StatusOK, map[string]any{
@@ -1429,6 +1478,7 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		writeJSON(w, http.StatusOK, out)
 	})
 	r.Get("/monitor/quota-details", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
@@ -1440,29 +1490,21 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 			writeJSONError(w, http.StatusNotImplemented, "quota details not supported")
 			return
 		}
-		q := services.QuotaDetailQuery{
-			ProviderName: strings.TrimSpace(req.URL.Query().Get("provider_name")),
-			ModelName:    strings.TrimSpace(req.URL.Query().Get("model_name")),
-			Limit:        parseIntQuery(req, "limit", 100),
-			Offset:       parseIntQuery(req, "offset", 0),
+		query := services.QuotaDetailQuery{
+			ProviderName: strings.TrimSpace(q.Get("provider_name")),
+			ModelName:    strings.TrimSpace(q.Get("model_name")),
+			Limit:        parseIntQuery(q, "limit", 100),
+			Offset:       parseIntQuery(q, "offset", 0),
 		}
-		if raw := strings.TrimSpace(req.URL.Query().Get("api_key_id")); raw != "" {
+		if raw := strings.TrimSpace(q.Get("api_key_id")); raw != "" {
 			var id int64
 			if _, err := fmt.Sscanf(raw, "%d", &id); err == nil && id > 0 {
-				q.APIKeyID = &id
+				query.APIKeyID = &id
 			}
 		}
-		if raw := strings.TrimSpace(req.URL.Query().Get("start_time")); raw != "" {
-			if ts, err := time.Parse(time.RFC3339, raw); err == nil {
-				q.StartTime = &ts
-			}
-		}
-		if raw := strings.TrimSpace(req.URL.Query().Get("end_time")); raw != "" {
-			if ts, err := time.Parse(time.RFC3339, raw); err == nil {
-				q.EndTime = &ts
-			}
-		}
-		out, err := qs.GetQuotaDetails(req.Context(), q)
+		query.StartTime = parseTimeQuery(q, "start_time")
+		query.EndTime = parseTimeQuery(q, "end_time")
+		out, err := qs.GetQuotaDetails(req.Context(), query)
 		if err != nil {
 			writeJSONError(w, http.StatusInternalServerError, "get quota details failed")
 			return
@@ -1470,6 +1512,7 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		writeJSON(w, http.StatusOK, out)
 	})
 	r.Get("/monitor/quota-details/export", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
@@ -1482,15 +1525,17 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 			writeJSONError(w, http.StatusNotImplemented, "quota details export not supported")
 			return
 		}
-		q := services.QuotaDetailQuery{
-			ProviderName: strings.TrimSpace(req.URL.Query().Get("provider_name")),
-			ModelName:    strings.TrimSpace(req.URL.Query().Get("model_name")),
-			Limit:        parseIntQuery(req, "limit", 1000),
-			Offset:       parseIntQuery(req, "offset", 0),
+		query := services.QuotaDetailQuery{
+			ProviderName: strings.TrimSpace(q.Get("provider_name")),
+			ModelName:    strings.TrimSpace(q.Get("model_name")),
+			Limit:        parseIntQuery(q, "limit", 1000),
+			Offset:       parseIntQuery(q, "offset", 0),
 		}
-		format := strings.ToLower(strings.TrimSpace(req.URL.Query().Get("format")))
+		query.StartTime = parseTimeQuery(q, "start_time")
+		query.EndTime = parseTimeQuery(q, "end_time")
+		format := strings.ToLower(strings.TrimSpace(q.Get("format")))
 		if format == "json" {
-			out, err := qs.GetQuotaDetails(req.Context(), q)
+			out, err := qs.GetQuotaDetails(req.Context(), query)
 			if err != nil {
 				writeJSONError(w, http.StatusInternalServerError, "export quota details json failed")
 				return
@@ -1498,7 +1543,7 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 			writeJSON(w, http.StatusOK, out)
 			return
 		}
-		data, err := qs.ExportQuotaDetailsCSV(req.Context(), q)
+		data, err := qs.ExportQuotaDetailsCSV(req.Context(), query)
 		if err != nil {
 			writeJSONError(w, http.StatusInternalServerError, "export quota details csv failed")
 			return
@@ -1562,15 +1607,16 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		writeJSON(w, http.StatusOK, reader.GetChannelLoadSnapshot())
 	})
 	r.Get("/monitor/time-series", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
-		granularity := strings.TrimSpace(req.URL.Query().Get("granularity"))
+		granularity := strings.TrimSpace(q.Get("granularity"))
 		if granularity == "" {
 			granularity = "day"
 		}
-		timeRangeHours := parseIntQuery(req, "time_range_hours", 168)
+		timeRangeHours := parseIntQuery(q, "time_range_hours", 168)
 		if timeRangeHours <= 0 {
 			writeJSONError(w, http.StatusBadRequest, "time_range_hours must be positive")
 			return
@@ -1591,19 +1637,20 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		writeJSON(w, http.StatusOK, out)
 	})
 	r.Get("/monitor/grouped-time-series", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
-		groupBy := strings.TrimSpace(req.URL.Query().Get("group_by"))
+		groupBy := strings.TrimSpace(q.Get("group_by"))
 		if groupBy == "" {
 			groupBy = "model"
 		}
-		granularity := strings.TrimSpace(req.URL.Query().Get("granularity"))
+		granularity := strings.TrimSpace(q.Get("granularity"))
 		if granularity == "" {
 			granularity = "day"
 		}
-		timeRangeHours := parseIntQuery(req, "time_range_hours", 168)
+		timeRangeHours := parseIntQuery(q, "time_range_hours", 168)
 		if timeRangeHours <= 0 {
 			writeJSONError(w, http.StatusBadRequest, "time_range_hours must be positive")
 			return
@@ -1624,26 +1671,33 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		writeJSON(w, http.StatusOK, out)
 	})
 	r.Get("/monitor/export/json", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
-		limit := parseIntQuery(req, "limit", 1000)
-		offset := parseIntQuery(req, "offset", 0)
+		limit := parseIntQuery(q, "limit", 1000)
+		offset := parseIntQuery(q, "offset", 0)
 		out, err := svc.ListInvocations(req.Context(), limit, offset)
 		if err != nil {
 			writeJSONError(w, http.StatusInternalServerError, "export monitor json failed")
 			return
 		}
+		format := strings.ToLower(strings.TrimSpace(q.Get("format")))
+		if format == "jsonl" || format == "ndjson" {
+			writeNDJSON(w, out)
+			return
+		}
 		writeJSON(w, http.StatusOK, out)
 	})
 	r.Get("/monitor/export/excel", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
-		limit := parseIntQuery(req, "limit", 1000)
-		offset := parseIntQuery(req, "offset", 0)
+		limit := parseIntQuery(q, "limit", 1000)
+		offset := parseIntQuery(q, "offset", 0)
 		data, err := svc.ExportInvocationsCSV(req.Context(), limit, offset)
 		if err != nil {
 			writeJSONError(w, http.StatusInternalServerError, "export monitor excel failed")
@@ -1655,14 +1709,15 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		_, _ = w.Write(data)
 	})
 	r.Get("/monitor/database", func(w http.ResponseWriter, req *http.Request) {
+		q := req.URL.Query()
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
-		format := strings.ToLower(strings.TrimSpace(req.URL.Query().Get("format")))
+		format := strings.ToLower(strings.TrimSpace(q.Get("format")))
 		if format == "zip" {
-			limit := parseIntQuery(req, "limit", 1000)
-			offset := parseIntQuery(req, "offset", 0)
+			limit := parseIntQuery(q, "limit", 1000)
+			offset := parseIntQuery(q, "offset", 0)
 			items, err := svc.ListInvocations(req.Context(), limit, offset)
 			if err != nil {
 				writeJSONError(w, http.StatusInternalServerError, "query monitor invocations failed")
@@ -1755,19 +1810,35 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 		}
 		writeJSON(w, http.StatusOK, out)
 	})
+	// The config hint is fixed for the router's lifetime, so remember the
+	// first successful filesystem resolution instead of walking up from cwd
+	// on every sync request.
+	var (
+		configPathMu     sync.Mutex
+		configPathCached string
+	)
 	r.Post("/config/sync", func(w http.ResponseWriter, req *http.Request) {
 		if svc == nil {
 			writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
 			return
 		}
-		hint := opts.ModelConfigHintPath
-		if strings.TrimSpace(hint) == "" {
-			hint = "router.toml"
-		}
-		resolved, err := config.ResolveModelConfigPath(hint)
-		if err != nil {
-			writeJSONError(w, http.StatusNotFound, fmt.Sprintf("model config not found: %v", err))
-			return
+		configPathMu.Lock()
+		resolved := configPathCached
+		configPathMu.Unlock()
+		if resolved == "" {
+			hint := opts.ModelConfigHintPath
+			if strings.TrimSpace(hint) == "" {
+				hint = "router.toml"
+			}
+			var err error
+			resolved, err = config.ResolveModelConfigPath(hint)
+			if err != nil {
+				writeJSONError(w, http.StatusNotFound, fmt.Sprintf("model config not found: %v", err))
+				return
+			}
+			configPathMu.Lock()
+			configPathCached = resolved
+			configPathMu.Unlock()
 		}
 		if err := svc.SyncRouterTOML(req.Context(), resolved); err != nil {
 			writeJSONError(w, http.StatusBadRequest, fmt.Sprintf("sync failed: %v", err))
@@ -1782,6 +1853,7 @@ func registerCoreRoutes(r chi.Router, svc CatalogService, sessions SessionStore,
 }
 
 func authMiddleware(svc CatalogService, sessions SessionStore, opts RouterOptions) func(http.Handler) http.Handler {
+	quotaChecker, hasQuotaChecker := svc.(apiKeyQuotaChecker)
 	return func(next http.Handler) http.Handler {
 		return http.HandlerFunc(func(w http.ResponseWriter, req *http.Request) {
 			if isPublicPath(req.URL.Path) {
@@ -1801,13 +1873,12 @@ func authMiddleware(svc CatalogService, sessions SessionStore, opts RouterOption
 				writeJSONError(w, http.StatusUnauthorized, "未认证。请先通过 /auth/login 登录获取 Session Token，或使用 API Key 进行认证。")
 				return
 			}
+			if svc == nil {
+				writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
+				return
+			}
 
-			if _, ok := sessions.Get(token); ok {
-				sessionData, _ := sessions.Get(token)
-				if svc == nil {
-					writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
-					return
-				}
+			if sessionData, ok := sessions.Get(token); ok {
 				item, err := svc.GetAPIKey(req.Context(), sessionData.APIKeyID)
 				if err != nil {
 					writeJSONError(w, http.StatusForbidden, "API Key 无效或已禁用。")
@@ -1821,28 +1892,21 @@ func authMiddleware(svc CatalogService, sessions SessionStore, opts RouterOption
 					writeJSONError(w, http.StatusForbidden, "请求来源 IP 不在允许范围内。")
 					return
 				}
-				if item.QuotaTokensMonth != nil {
-					if checker, ok := svc.(interface {
-						CheckAPIKeyQuota(ctx context.Context, apiKeyID int64, quotaTokensMonthly int64) error
-					}); ok {
-						if err := checker.CheckAPIKeyQuota(req.Context(), item.ID, *item.QuotaTokensMonth); err != nil {
-							writeJSONError(w, http.StatusForbidden, "API Key 月度配额已用尽。")
-							return
-						}
+				if item.QuotaTokensMonth != nil && hasQuotaChecker {
+					if err := quotaChecker.CheckAPIKeyQuota(req.Context(), item.ID, *item.QuotaTokensMonth); err != nil {
+						writeJSONError(w, http.StatusForbidden, "API Key 月度配额已用尽。")
+						return
 					}
 				}
 				ctx := withAuthContext(req.Context(), authContextData{
 					APIKey:   item,
 					Policy:   services.NewAPIKeyPolicy(item),
 					AuthType: "session_token",
+					Limits:   compileParameterLimits(item.ParameterLimits),
 				})
 				next.ServeHTTP(w, req.WithContext(ctx))
 				return
 			}
-			if svc == nil {
-				writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
-				return
-			}
 			if item, err := svc.ValidateAPIKey(req.Context(), token); err == nil {
 				if err := checkAPIKeyLifecycle(item); err != nil {
 					writeJSONError(w, http.StatusForbidden, "API Key 已过期。")
@@ -1852,20 +1916,17 @@ func authMiddleware(svc CatalogService, sessions SessionStore, opts RouterOption
 					writeJSONError(w, http.StatusForbidden, "请求来源 IP 不在允许范围内。")
 					return
 				}
-				if item.QuotaTokensMonth != nil {
-					if checker, ok := svc.(interface {
-						CheckAPIKeyQuota(ctx context.Context, apiKeyID int64, quotaTokensMonthly int64) error
-					}); ok {
-						if err := checker.CheckAPIKeyQuota(req.Context(), item.ID, *item.QuotaTokensMonth); err != nil {
-							writeJSONError(w, http.StatusForbidden, "API Key 月度配额已用尽。")
-							return
-						}
+				if item.QuotaTokensMonth != nil && hasQuotaChecker {
+					if err := quotaChecker.CheckAPIKeyQuota(req.Context(), item.ID, *item.QuotaTokensMonth); err != nil {
+						writeJSONError(w, http.StatusForbidden, "API Key 月度配额已用尽。")
+						return
 					}
 				}
 				ctx := withAuthContext(req.Context(), authContextData{
 					APIKey:   item,
 					Policy:   services.NewAPIKeyPolicy(item),
 					AuthType: "api_key",
+					Limits:   compileParameterLimits(item.ParameterLimits),
 				})
 				next.ServeHTTP(w, req.WithContext(ctx))
 				return
@@ -1906,14 +1967,57 @@ func isLocalRequest(req *http.Request) bool {
 	return ip.IsLoopback()
 }
 
+var jsonBufferPool = sync.Pool{
+	New: func() any { return new(bytes.Buffer) },
+}
+
+// jsonBufferPoolMaxCap drops oversized buffers on return so one large chat
+// completion or monitor export does not pin megabytes inside the pool.
+const jsonBufferPoolMaxCap = 64 << 10
+
+// writeJSON encodes with the stdlib encoder straight into a pooled buffer:
+// the encoding is compiled code already, so the wins worth taking here are
+// buffer reuse and a Content-Length header, not a different serializer.
 func writeJSON(w http.ResponseWriter, status int, payload any) {
+	buf := jsonBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	defer func() {
+		if buf.Cap() <= jsonBufferPoolMaxCap {
+			jsonBufferPool.Put(buf)
+		}
+	}()
+	if err := json.NewEncoder(buf).Encode(payload); err != nil {
+		w.Header().Set("Content-Type", "application/json")
+		w.WriteHeader(http.StatusInternalServerError)
+		return
+	}
 	w.Header().Set("Content-Type", "application/json")
+	w.Header().Set("Content-Length", strconv.Itoa(buf.Len()))
 	w.WriteHeader(status)
-	_ = json.NewEncoder(w).Encode(payload)
+	_, _ = w.Write(buf.Bytes())
+}
+
+func writeNDJSON(w http.ResponseWriter, items []schemas.MonitorInvocation) {
+	w.Header().Set("Content-Type", "application/x-ndjson")
+	w.WriteHeader(http.StatusOK)
+	flusher, _ := w.(http.Flusher)
+	enc := json.NewEncoder(w)
+	for i := range items {
+		if err := enc.Encode(items[i]); err != nil {
+			return
+		}
+		if flusher != nil {
+			flusher.Flush()
+		}
+	}
+}
+
+type errorEnvelope struct {
+	Detail string `json:"detail"`
 }
 
 func writeJSONError(w http.ResponseWriter, status int, detail string) {
-	writeJSON(w, status, map[string]any{"detail": detail})
+	writeJSON(w, status, errorEnvelope{Detail: detail})
 }
 
 func writeInvokeError(w http.ResponseWriter, err error, fallbackDetail string) {
@@ -2008,7 +2112,11 @@ func handleOpenAIChatCompletions(w http.ResponseWriter, req *http.Request, svc C
 	writeJSON(w, http.StatusOK, out)
 }
 
-func streamSSE(ctx context.Context, w http.ResponseWriter, streamResp *services.StreamResponse) {
+// copySSE pumps upstream lines to the client until EOF, cancellation, or an
+// idle timeout. observe, when non-nil, sees every line before it is written;
+// both plain and usage-tracked streaming share this loop so hot-path changes
+// land in one place.
+func copySSE(ctx context.Context, w http.ResponseWriter, streamResp *services.StreamResponse, observe func(string)) {
 	contentType := streamResp.ContentType
 	if strings.TrimSpace(contentType) == "" {
 		contentType = "text/event-stream"
@@ -2018,10 +2126,14 @@ func streamSSE(ctx context.Context, w http.ResponseWriter, streamResp *services.
 	w.Header().Set("Connection", "keep-alive")
 	w.WriteHeader(http.StatusOK)
 	flusher, _ := w.(http.Flusher)
-	reader := bufio.NewReader(streamResp.Body)
+	reader := newSSELineReader(streamResp.Body)
+	defer reader.close()
 	for {
-		line, err := readLineWithTimeout(ctx, reader, streamIdleTimeout)
+		line, err := reader.next(ctx, streamIdleTimeout)
 		if line != "" {
+			if observe != nil {
+				observe(line)
+			}
 			if _, writeErr := io.WriteString(w, line); writeErr != nil {
 				return
 			}
@@ -2034,17 +2146,20 @@ func streamSSE(ctx context.Context, w http.ResponseWriter, streamResp *services.
 				return
 			}
 			if errors.Is(err, context.DeadlineExceeded) {
-				_, _ = io.WriteString(w, "data: {\"error\":\"stream_timeout\"}\n\n")
+				_, _ = w.Write(sseTimeoutEvent)
 				if flusher != nil {
 					flusher.Flush()
 				}
-				return
 			}
 			return
 		}
 	}
 }
 
+func streamSSE(ctx context.Context, w http.ResponseWriter, streamResp *services.StreamResponse) {
+	copySSE(ctx, w, streamResp, nil)
+}
+
 type streamUsageTracker struct {
 	tokens int64
 	cost   float64
@@ -2054,6 +2169,13 @@ func (t *streamUsageTracker) ObserveSSELine(line string) {
 	if t == nil {
 		return
 	}
+	// Token-delta chunks carry no accounting fields; probing for the key
+	// names first skips a full JSON decode per streamed token. A false
+	// positive (key name inside content text) only costs one extra parse.
+	if !strings.Contains(line, `"usage"`) && !strings.Contains(line, `"cost"`) &&
+		!strings.Contains(line, `"usageMetadata"`) {
+		return
+	}
 	payload, ok := parseSSEDataPayload(line)
 	if !ok {
 		return
@@ -2082,13 +2204,24 @@ func (t *streamUsageTracker) Snapshot() map[string]any {
 	return out
 }
 
+// sseDataPayload extracts the payload of a "data:" SSE line. Upstreams emit
+// the prefix at column zero, so the untrimmed check settles almost every line
+// on its first byte; the trimmed fallback keeps tolerance for nonconforming
+// framing.
+func sseDataPayload(line string) (string, bool) {
+	if !strings.HasPrefix(line, "data:") {
+		trimmed := strings.TrimSpace(line)
+		if !strings.HasPrefix(trimmed, "data:") {
+			return "", false
+		}
+		line = trimmed
+	}
+	return strings.TrimSpace(line[len("data:"):]), true
+}
+
 func parseSSEDataPayload(line string) (map[string]any, bool) {
-	trimmed := strings.TrimSpace(line)
-	if !strings.HasPrefix(trimmed, "data:") {
-		return nil, false
-	}
-	payload := strings.TrimSpace(strings.TrimPrefix(trimmed, "data:"))
-	if payload == "" || payload == "[DONE]" {
+	payload, ok := sseDataPayload(line)
+	if !ok || payload == "" || payload == "[DONE]" {
 		return nil, false
 	}
 	var out map[string]any
@@ -2119,41 +2252,7 @@ func streamSSEAndTrackUsage(req *http.Request, svc CatalogService, w http.Respon
 	defer func() {
 		maybeAccumulateUsage(req, svc, tracker.Snapshot(), fallbackTokens)
 	}()
-	contentType := streamResp.ContentType
-	if strings.TrimSpace(contentType) == "" {
-		contentType = "text/event-stream"
-	}
-	w.Header().Set("Content-Type", contentType)
-	w.Header().Set("Cache-Control", "no-cache")
-	w.Header().Set("Connection", "keep-alive")
-	w.WriteHeader(http.StatusOK)
-	flusher, _ := w.(http.Flusher)
-	reader := bufio.NewReader(streamResp.Body)
-	for {
-		line, err := readLineWithTimeout(req.Context(), reader, streamIdleTimeout)
-		if line != "" {
-			tracker.ObserveSSELine(line)
-			if _, writeErr := io.WriteString(w, line); writeErr != nil {
-				return
-			}
-			if flusher != nil {
-				flusher.Flush()
-			}
-		}
-		if err != nil {
-			if errors.Is(err, io.EOF) || errors.Is(err, context.Canceled) {
-				return
-			}
-			if errors.Is(err, context.DeadlineExceeded) {
-				_, _ = io.WriteString(w, "data: {\"error\":\"stream_timeout\"}\n\n")
-				if flusher != nil {
-					flusher.Flush()
-				}
-				return
-			}
-			return
-		}
-	}
+	copySSE(req.Context(), w, streamResp, tracker.ObserveSSELine)
 }
 
 func streamGeminiSSE(ctx context.Context, w http.ResponseWriter, streamResp *services.StreamResponse) {
@@ -2163,21 +2262,22 @@ func streamGeminiSSE(ctx context.Context, w http.ResponseWriter, streamResp *ser
 	w.WriteHeader(http.StatusOK)
 	flusher, _ := w.(http.Flusher)
 
-	reader := bufio.NewReader(streamResp.Body)
+	reader := newSSELineReader(streamResp.Body)
+	defer reader.close()
 	for {
-		line, err := readLineWithTimeout(ctx, reader, streamIdleTimeout)
+		line, err := reader.next(ctx, streamIdleTimeout)
 		if line != "" {
-			trimmed := strings.TrimSpace(line)
-			if strings.HasPrefix(trimmed, "data:") {
-				payload := strings.TrimSpace(strings.TrimPrefix(trimmed, "data:"))
+			if payload, ok := sseDataPayload(line); ok {
 				converted, handled := convertOpenAIStreamChunkToGemini(payload)
 				if handled {
-					_, _ = w.Write([]byte("data: " + converted + "\n\n"))
+					_, _ = w.Write(ssePrefix)
+					_, _ = io.WriteString(w, converted)
+					_, _ = w.Write(sseSuffix)
 				} else {
-					_, _ = w.Write([]byte(line))
+					_, _ = io.WriteString(w, line)
 				}
 			} else {
-				_, _ = w.Write([]byte(line))
+				_, _ = io.WriteString(w, line)
 			}
 			if flusher != nil {
 				flusher.Flush()
@@ -2188,7 +2288,7 @@ func streamGeminiSSE(ctx context.Context, w http.ResponseWriter, streamResp *ser
 				break
 			}
 			if errors.Is(err, context.DeadlineExceeded) {
-				_, _ = io.WriteString(w, "data: {\"error\":\"stream_timeout\"}\n\n")
+				_, _ = w.Write(sseTimeoutEvent)
 				if flusher != nil {
 					flusher.Flush()
 				}
@@ -2198,30 +2298,75 @@ func streamGeminiSSE(ctx context.Context, w http.ResponseWriter, streamResp *ser
 	}
 }
 
+var (
+	ssePrefix       = []byte("data: ")
+	sseSuffix       = []byte("\n\n")
+	sseTimeoutEvent = []byte("data: {\"error\":\"stream_timeout\"}\n\n")
+)
+
 type readLineResult struct {
 	line string
 	err  error
 }
 
-func readLineWithTimeout(ctx context.Context, reader *bufio.Reader, timeout time.Duration) (string, error) {
-	if timeout <= 0 {
-		timeout = 45 * time.Second
+// sseLineReader pumps upstream lines on a single goroutine for the stream's
+// lifetime, so each next call costs one channel receive instead of spawning a
+// goroutine and an idle-timeout timer per streamed token.
+type sseLineReader struct {
+	ch    chan readLineResult
+	done  chan struct{}
+	timer *time.Timer
+}
+
+func newSSELineReader(body io.Reader) *sseLineReader {
+	r := &sseLineReader{
+		ch:   make(chan readLineResult, 16),
+		done: make(chan struct{}),
 	}
-	ch := make(chan readLineResult, 1)
 	go func() {
-		line, err := reader.ReadString('\n')
-		ch <- readLineResult{line: line, err: err}
+		reader := bufio.NewReader(body)
+		for {
+			line, err := reader.ReadString('\n')
+			select {
+			case r.ch <- readLineResult{line: line, err: err}:
+			case <-r.done:
+				return
+			}
+			if err != nil {
+				return
+			}
+		}
 	}()
+	return r
+}
+
+func (r *sseLineReader) next(ctx context.Context, timeout time.Duration) (string, error) {
+	if timeout <= 0 {
+		timeout = 45 * time.Second
+	}
+	// Reset without drain is safe on the modern (Go 1.23+) timer semantics
+	// this module requires.
+	if r.timer == nil {
+		r.timer = time.NewTimer(timeout)
+	} else {
+		r.timer.Reset(timeout)
+	}
+	defer r.timer.Stop()
 	select {
 	case <-ctx.Done():
 		return "", context.Canceled
-	case <-time.After(timeout):
+	case <-r.timer.C:
 		return "", context.DeadlineExceeded
-	case out := <-ch:
+	case out := <-r.ch:
 		return out.line, out.err
 	}
 }
 
+// close releases the pump goroutine; the caller still owns the body.
+func (r *sseLineReader) close() {
+	close(r.done)
+}
+
 func openStreamWithRetry(ctx context.Context, openFn func() (*services.StreamResponse, error)) (*services.StreamResponse, error) {
 	var lastErr error
 	for attempt := 0; attempt < streamOpenRetryAttempts; attempt++ {
@@ -2236,7 +2381,7 @@ func openStreamWithRetry(ctx context.Context, openFn func() (*services.StreamRes
 		select {
 		case <-ctx.Done():
 			return nil, context.Canceled
-		case <-time.After(streamOpenRetryBackoff):
+		case <-time.After(streamOpenRetryDelay(attempt)):
 		}
 	}
 	return nil, lastErr
@@ -2250,6 +2395,22 @@ func shouldRetryStreamOpenError(err error) bool {
 	return true
 }
 
+// openAIStreamChunk captures only the fields the Gemini conversion reads, so
+// per-token chunks decode into a small struct instead of a generic map that
+// materializes every ignored field (id, created, model, ...).
+type openAIStreamChunk struct {
+	Choices []struct {
+		Delta struct {
+			Content string `json:"content"`
+		} `json:"delta"`
+	} `json:"choices"`
+	Usage *struct {
+		PromptTokens     any `json:"prompt_tokens"`
+		CompletionTokens any `json:"completion_tokens"`
+		TotalTokens      any `json:"total_tokens"`
+	} `json:"usage"`
+}
+
 func convertOpenAIStreamChunkToGemini(payload string) (string, bool) {
 	if payload == "" {
 		return "", false
@@ -2257,19 +2418,13 @@ func convertOpenAIStreamChunkToGemini(payload string) (string, bool) {
 	if payload == "[DONE]" {
 		return "[DONE]", true
 	}
-	var chunk map[string]any
+	var chunk openAIStreamChunk
 	if err := json.Unmarshal([]byte(payload), &chunk); err != nil {
 		return "", false
 	}
 	text := ""
-	if choices, ok := chunk["choices"].([]any); ok && len(choices) > 0 {
-		if choice0, ok := choices[0].(map[string]any); ok {
-			if delta, ok := choice0["delta"].(map[string]any); ok {
-				if content, ok := delta["content"].(string); ok {
-					text = content
-				}
-			}
-		}
+	if len(chunk.Choices) > 0 {
+		text = chunk.Choices[0].Delta.Content
 	}
 	if text == "" {
 		return "", false
@@ -2287,11 +2442,11 @@ func convertOpenAIStreamChunkToGemini(payload string) (string, bool) {
 			},
 		},
 	}
-	if usage, ok := chunk["usage"].(map[string]any); ok {
+	if chunk.Usage != nil {
 		out["usageMetadata"] = map[string]any{
-			"promptTokenCount":     usage["prompt_tokens"],
-			"candidatesTokenCount": usage["completion_tokens"],
-			"totalTokenCount":      usage["total_tokens"],
+			"promptTokenCount":     chunk.Usage.PromptTokens,
+			"candidatesTokenCount": chunk.Usage.CompletionTokens,
+			"totalTokenCount":      chunk.Usage.TotalTokens,
 		}
 	}
 	raw, err := json.Marshal(out)
@@ -2401,7 +2556,7 @@ func enforcePayloadPolicy(req *http.Request, providerHint string, payload map[st
 	if !authData.Policy.IsModelAllowed(providerName, modelName) {
 		return nil, http.StatusForbidden, "API Key 策略不允许调用该模型或渠道。"
 	}
-	applyParameterLimits(payload, authData.Policy.ParameterLimits)
+	applyParameterLimits(payload, authData.Limits)
 	return payload, 0, ""
 }
 
@@ -2490,8 +2645,8 @@ func toFloat64(v any) (float64, bool) {
 	}
 }
 
-func parseIntQuery(req *http.Request, key string, defaultValue int) int {
-	raw := strings.TrimSpace(req.URL.Query().Get(key))
+func parseIntQuery(q url.Values, key string, defaultValue int) int {
+	raw := strings.TrimSpace(q.Get(key))
 	if raw == "" {
 		return defaultValue
 	}
@@ -2502,6 +2657,31 @@ func parseIntQuery(req *http.Request, key string, defaultValue int) int {
 	return v
 }
 
+// weakListETag builds a weak validator from row count plus newest updated_at,
+// enough to detect any create/update/delete on the catalog list endpoints.
+func weakListETag(count int64, updated *time.Time) string {
+	ts := int64(0)
+	if updated != nil {
+		ts = updated.Unix()
+	}
+	return fmt.Sprintf(`W/"%d-%d"`, count, ts)
+}
+
+func parseTimeQuery(q url.Values, key string) *time.Time {
+	raw := strings.TrimSpace(q.Get(key))
+	if raw == "" {
+		return nil
+	}
+	if ts, err := time.Parse(time.RFC3339, raw); err == nil {
+		return &ts
+	}
+	if ts, err := time.Parse("2006-01-02T15:04:05", raw); err == nil {
+		ts = ts.UTC()
+		return &ts
+	}
+	return nil
+}
+
 var (
 	videoJobsMu sync.RWMutex
 	videoJobs   = map[string]map[string]any{}
@@ -2520,6 +2700,18 @@ func videoJobStoreGet(id string) map[string]any {
 	return item
 }
 
+// responsesParamMapping maps /v1/responses parameter names onto their
+// chat-completions equivalents; declared once so the copy below is a
+// single loop instead of a chain of per-field checks.
+var responsesParamMapping = []struct {
+	from string
+	to   string
+}{
+	{"temperature", "temperature"},
+	{"top_p", "top_p"},
+	{"max_output_tokens", "max_tokens"},
+}
+
 func handleOpenAIResponses(w http.ResponseWriter, req *http.Request, svc CatalogService) {
 	if svc == nil {
 		writeJSONError(w, http.StatusServiceUnavailable, "catalog service unavailable")
@@ -2546,14 +2738,10 @@ func handleOpenAIResponses(w http.ResponseWriter, req *http.Request, svc Catalog
 		"model":    model,
 		"messages": messages,
 	}
-	if v, ok := payload["temperature"]; ok {
-		chatPayload["temperature"] = v
-	}
-	if v, ok := payload["top_p"]; ok {
-		chatPayload["top_p"] = v
-	}
-	if v, ok := payload["max_output_tokens"]; ok {
-		chatPayload["max_tokens"] = v
+	for _, mapping := range responsesParamMapping {
+		if v, ok := payload[mapping.from]; ok {
+			chatPayload[mapping.to] = v
+		}
 	}
 	if stream, ok := payload["stream"].(bool); ok && stream {
 		chatPayload["stream"] = true
@@ -2589,7 +2777,11 @@ func handleOpenAIResponses(w http.ResponseWriter, req *http.Request, svc Catalog
 }
 
 func responsesInputToMessages(input any, instructions string) []map[string]any {
-	messages := make([]map[string]any, 0)
+	capacity := 1
+	if items, ok := input.([]any); ok {
+		capacity = len(items) + 1
+	}
+	messages := make([]map[string]any, 0, capacity)
 	if strings.TrimSpace(instructions) != "" {
 		messages = append(messages, map[string]any{"role": "system", "content": instructions})
 	}
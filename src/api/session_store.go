@@ -1,12 +1,28 @@
 package api
 
 import (
+	"bufio"
+	"container/heap"
 	"crypto/rand"
 	"encoding/hex"
+	"io"
+	"strconv"
 	"sync"
 	"time"
 )
 
+// defaultSessionTTL bounds how long an untouched session stays valid; reads
+// slide the deadline forward so active sessions never expire mid-use.
+const defaultSessionTTL = 24 * time.Hour
+
+// defaultMaxSessions caps the in-memory store so a burst of session creation
+// cannot grow it without bound; the sessions closest to expiry (i.e. least
+// recently refreshed, since reads slide the deadline) are evicted first.
+const defaultMaxSessions = 10000
+
+// SessionData deliberately references the api_keys row by id only; the key
+// material itself is re-resolved from the database on each authenticated
+// request and never retained in session state.
 type SessionData struct {
 	Token              string
 	APIKeyID           int64
@@ -17,6 +33,7 @@ type SessionData struct {
 	WeakProviderName   string
 	WeakModelName      string
 	CreatedAt          time.Time
+	ExpiresAt          time.Time
 }
 
 type SessionStore interface {
@@ -27,43 +44,201 @@ type SessionStore interface {
 	BindProfileModel(token string, providerName string, modelName string, bindingType string) bool
 }
 
+// MemorySessionStore keys sessions by the first 64 bits of the random token
+// rather than the full 48-char string: integer map lookups skip string
+// hashing, and the prefix of a CSPRNG token carries enough entropy that
+// collisions are vanishingly rare. The full token is still compared on every
+// lookup, so a prefix collision can never leak another caller's session.
 type MemorySessionStore struct {
-	mu    sync.RWMutex
-	items map[string]SessionData
+	mu          sync.RWMutex
+	ttl         time.Duration
+	maxSessions int
+	items       map[uint64]SessionData
+	expiry      sessionExpiryHeap
+	timer       *time.Timer
+	timerAt     time.Time
 }
 
 func NewMemorySessionStore() *MemorySessionStore {
 	return &MemorySessionStore{
-		items: map[string]SessionData{},
+		ttl:         defaultSessionTTL,
+		maxSessions: defaultMaxSessions,
+		items:       map[uint64]SessionData{},
 	}
 }
 
-func (s *MemorySessionStore) Create(apiKeyID int64) (SessionData, error) {
-	token, err := randomToken(24)
+// sessionTokenKey folds the leading 16 hex digits of a token into the map
+// key. Tokens from other sources (wrong length, non-hex) simply never match.
+func sessionTokenKey(token string) (uint64, bool) {
+	if len(token) < 16 {
+		return 0, false
+	}
+	key, err := strconv.ParseUint(token[:16], 16, 64)
 	if err != nil {
-		return SessionData{}, err
+		return 0, false
+	}
+	return key, true
+}
+
+// sessionExpiryEntry is a lazy-deleted heap record: sliding a session's TTL
+// pushes a fresh entry instead of repositioning the old one, and stale heads
+// are skipped when they disagree with the live ExpiresAt.
+type sessionExpiryEntry struct {
+	expiresAt time.Time
+	key       uint64
+}
+
+type sessionExpiryHeap []sessionExpiryEntry
+
+func (h sessionExpiryHeap) Len() int           { return len(h) }
+func (h sessionExpiryHeap) Less(i, j int) bool { return h[i].expiresAt.Before(h[j].expiresAt) }
+func (h sessionExpiryHeap) Swap(i, j int)      { h[i], h[j] = h[j], h[i] }
+func (h *sessionExpiryHeap) Push(x any)        { *h = append(*h, x.(sessionExpiryEntry)) }
+func (h *sessionExpiryHeap) Pop() any {
+	old := *h
+	n := len(old)
+	item := old[n-1]
+	*h = old[:n-1]
+	return item
+}
+
+// purgeExpiredLocked drops sessions whose deadline has passed, touching only
+// the heap head instead of scanning the whole map. Callers hold the write lock.
+func (s *MemorySessionStore) purgeExpiredLocked(now time.Time) {
+	for len(s.expiry) > 0 && !s.expiry[0].expiresAt.After(now) {
+		entry := heap.Pop(&s.expiry).(sessionExpiryEntry)
+		current, ok := s.items[entry.key]
+		if !ok || current.ExpiresAt.After(now) {
+			continue
+		}
+		delete(s.items, entry.key)
+	}
+}
+
+func (s *MemorySessionStore) Create(apiKeyID int64) (SessionData, error) {
+	// time.Now keeps its monotonic clock reading as long as the value is not
+	// passed through UTC/Local, so expiry arithmetic is immune to wall-clock
+	// jumps; only the display timestamp is converted.
+	now := time.Now()
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	var (
+		token string
+		key   uint64
+	)
+	for {
+		t, err := randomToken(24)
+		if err != nil {
+			return SessionData{}, err
+		}
+		k, ok := sessionTokenKey(t)
+		if !ok {
+			continue
+		}
+		// A 64-bit prefix collision with a live session is effectively
+		// impossible; regenerate rather than clobber it if one ever occurs.
+		if _, taken := s.items[k]; taken {
+			continue
+		}
+		token, key = t, k
+		break
 	}
 	data := SessionData{
 		Token:     token,
 		APIKeyID:  apiKeyID,
-		CreatedAt: time.Now().UTC(),
+		CreatedAt: now.UTC(),
+		ExpiresAt: now.Add(s.ttl),
+	}
+	s.items[key] = data
+	heap.Push(&s.expiry, sessionExpiryEntry{expiresAt: data.ExpiresAt, key: key})
+	s.evictOverCapLocked()
+	s.armTimerLocked()
+	return data, nil
+}
+
+// evictOverCapLocked drops the sessions nearest expiry until the store is
+// back under maxSessions. Heap entries whose deadline disagrees with the live
+// session are stale duplicates from TTL slides and are skipped without
+// evicting anything. Callers hold the write lock.
+func (s *MemorySessionStore) evictOverCapLocked() {
+	for len(s.items) > s.maxSessions && len(s.expiry) > 0 {
+		entry := heap.Pop(&s.expiry).(sessionExpiryEntry)
+		current, ok := s.items[entry.key]
+		if !ok || !current.ExpiresAt.Equal(entry.expiresAt) {
+			continue
+		}
+		delete(s.items, entry.key)
 	}
+}
+
+// armTimerLocked keeps a single timer pointed at the heap head, so the store
+// sleeps until the next session is actually due instead of being polled.
+// Callers hold the write lock.
+func (s *MemorySessionStore) armTimerLocked() {
+	if len(s.expiry) == 0 {
+		return
+	}
+	head := s.expiry[0].expiresAt
+	if s.timer == nil {
+		s.timer = time.AfterFunc(time.Until(head), s.onExpiryTimer)
+		s.timerAt = head
+		return
+	}
+	if !head.Equal(s.timerAt) {
+		s.timer.Reset(time.Until(head))
+		s.timerAt = head
+	}
+}
+
+func (s *MemorySessionStore) onExpiryTimer() {
 	s.mu.Lock()
-	s.items[token] = data
+	s.purgeExpiredLocked(time.Now())
+	s.timerAt = time.Time{}
+	s.armTimerLocked()
 	s.mu.Unlock()
-	return data, nil
 }
 
 func (s *MemorySessionStore) Get(token string) (SessionData, bool) {
+	key, valid := sessionTokenKey(token)
+	if !valid {
+		return SessionData{}, false
+	}
+	now := time.Now()
 	s.mu.RLock()
-	defer s.mu.RUnlock()
-	data, ok := s.items[token]
-	return data, ok
+	data, ok := s.items[key]
+	s.mu.RUnlock()
+	if !ok || data.Token != token {
+		return SessionData{}, false
+	}
+	if now.After(data.ExpiresAt) {
+		s.mu.Lock()
+		// Re-check under the write lock: the session may have been
+		// refreshed or recreated between the two lock acquisitions.
+		if current, stillThere := s.items[key]; stillThere && current.Token == token && now.After(current.ExpiresAt) {
+			delete(s.items, key)
+		}
+		s.mu.Unlock()
+		return SessionData{}, false
+	}
+	data.ExpiresAt = now.Add(s.ttl)
+	s.mu.Lock()
+	if current, stillThere := s.items[key]; stillThere && current.Token == token {
+		s.items[key] = data
+		heap.Push(&s.expiry, sessionExpiryEntry{expiresAt: data.ExpiresAt, key: key})
+	}
+	s.mu.Unlock()
+	return data, true
 }
 
 func (s *MemorySessionStore) Delete(token string) {
+	key, valid := sessionTokenKey(token)
+	if !valid {
+		return
+	}
 	s.mu.Lock()
-	delete(s.items, token)
+	if current, ok := s.items[key]; ok && current.Token == token {
+		delete(s.items, key)
+	}
 	s.mu.Unlock()
 }
 
@@ -72,10 +247,14 @@ func (s *MemorySessionStore) BindModel(token string, providerName string, modelN
 }
 
 func (s *MemorySessionStore) BindProfileModel(token string, providerName string, modelName string, bindingType string) bool {
+	key, valid := sessionTokenKey(token)
+	if !valid {
+		return false
+	}
 	s.mu.Lock()
 	defer s.mu.Unlock()
-	item, ok := s.items[token]
-	if !ok {
+	item, ok := s.items[key]
+	if !ok || item.Token != token {
 		return false
 	}
 	switch bindingType {
@@ -89,13 +268,23 @@ func (s *MemorySessionStore) BindProfileModel(token string, providerName string,
 		item.ProviderName = providerName
 		item.ModelName = modelName
 	}
-	s.items[token] = item
+	s.items[key] = item
 	return true
 }
 
+// tokenRandPool buffers CSPRNG output so bursts of session creation draw one
+// getrandom syscall per buffer refill instead of one per token.
+var (
+	tokenRandMu   sync.Mutex
+	tokenRandPool = bufio.NewReaderSize(rand.Reader, 4096)
+)
+
 func randomToken(byteLen int) (string, error) {
 	buf := make([]byte, byteLen)
-	if _, err := rand.Read(buf); err != nil {
+	tokenRandMu.Lock()
+	_, err := io.ReadFull(tokenRandPool, buf)
+	tokenRandMu.Unlock()
+	if err != nil {
 		return "", err
 	}
 	return hex.EncodeToString(buf), nil
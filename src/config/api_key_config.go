@@ -15,6 +15,19 @@ type ParameterLimits struct {
 	CustomLimits     map[string]any `json:"custom_limits,omitempty" toml:"custom_limits"`
 }
 
+func (l *ParameterLimits) maxTokensOnly() bool {
+	return l.MaxTokens != nil &&
+		l.Temperature == nil &&
+		l.TopP == nil &&
+		l.FrequencyPenalty == nil &&
+		l.PresencePenalty == nil
+}
+
+// APIKeyConfig is the parse-only surface for [api_keys] entries in
+// router.toml. It is read during catalog sync and never consulted on the
+// request path: authenticated requests use the compiled runtime forms
+// (services.APIKeyPolicy for allowlists, the api layer's compiled parameter
+// limits), which pre-build their derived structures once per auth.
 type APIKeyConfig struct {
 	Key              *string          `json:"key,omitempty" toml:"key"`
 	KeyEnv           *string          `json:"key_env,omitempty" toml:"key_env"`
@@ -61,15 +74,31 @@ func (c APIKeyConfig) IsModelAllowed(providerName, modelName string) bool {
 	return contains(c.AllowedModels, modelName) || contains(c.AllowedModels, fullName)
 }
 
+// ValidateParameters returns the input map untouched when no limits are
+// configured; callers only receive a copy when a cap may actually apply.
 func (c APIKeyConfig) ValidateParameters(parameters map[string]any) map[string]any {
-	out := map[string]any{}
-	for k, v := range parameters {
-		out[k] = v
-	}
 	if c.ParameterLimits == nil {
-		return out
+		return parameters
 	}
 	limits := c.ParameterLimits
+	if limits.maxTokensOnly() {
+		// Common case: the key caps only max_tokens. Skip the copy entirely
+		// when the request is already within the cap.
+		mt := float64(*limits.MaxTokens)
+		if current, within := withinNumericLimit(parameters["max_tokens"], mt); within && current != nil {
+			return parameters
+		}
+		out := make(map[string]any, len(parameters)+1)
+		for k, v := range parameters {
+			out[k] = v
+		}
+		out["max_tokens"] = minNumeric(out["max_tokens"], mt)
+		return out
+	}
+	out := make(map[string]any, len(parameters))
+	for k, v := range parameters {
+		out[k] = v
+	}
 	if limits.MaxTokens != nil {
 		out["max_tokens"] = minNumeric(out["max_tokens"], float64(*limits.MaxTokens))
 	}
@@ -109,28 +138,52 @@ func contains(items []string, target string) bool {
 	return false
 }
 
+// withinNumericLimit reports whether current is a numeric value that already
+// satisfies limit; non-numeric values count as within (minNumeric leaves them
+// untouched) so the caller can skip copying the parameter map.
+func withinNumericLimit(current any, limit float64) (any, bool) {
+	switch v := current.(type) {
+	case nil:
+		return nil, false
+	case int:
+		return v, float64(v) <= limit
+	case int32:
+		return v, float64(v) <= limit
+	case int64:
+		return v, float64(v) <= limit
+	case float32:
+		return v, float64(v) <= limit
+	case float64:
+		return v, v <= limit
+	default:
+		return v, true
+	}
+}
+
+// minNumeric clamps current to limit while preserving the incoming numeric
+// type, so an integer max_tokens stays an integer after capping.
 func minNumeric(current any, limit float64) any {
 	switch v := current.(type) {
 	case nil:
 		return limit
 	case int:
 		if float64(v) > limit {
-			return limit
+			return int(limit)
 		}
 		return v
 	case int32:
 		if float64(v) > limit {
-			return limit
+			return int32(limit)
 		}
 		return v
 	case int64:
 		if float64(v) > limit {
-			return limit
+			return int64(limit)
 		}
 		return v
 	case float32:
 		if float64(v) > limit {
-			return limit
+			return float32(limit)
 		}
 		return v
 	case float64:
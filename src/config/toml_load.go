@@ -4,6 +4,9 @@ import (
 	"encoding/json"
 	"fmt"
 	"os"
+	"path/filepath"
+	"sync"
+	"time"
 
 	"github.com/pelletier/go-toml/v2"
 )
@@ -13,9 +16,52 @@ var reservedTOMLRoots = map[string]struct{}{
 	"server": {}, "monitor": {}, "routing": {}, "plugins": {}, "model_updates": {},
 }
 
+// tomlCacheEntry remembers one parsed config together with the file identity
+// (mtime + size) it was parsed from, so unchanged files short-circuit the
+// read/parse/decode pipeline on reload.
+type tomlCacheEntry struct {
+	modTime time.Time
+	size    int64
+	cfg     RouterModelConfig
+}
+
+var (
+	tomlCacheMu sync.Mutex
+	tomlCache   = map[string]tomlCacheEntry{}
+)
+
 // LoadRouterModelConfigFromTOML parses router.toml (including nested provider blocks with models, like Python load_model_config).
+// Parsing uses go-toml/v2, the maintained native parser for this layout.
+// Results are cached per absolute path keyed by the file's mtime and size;
+// the cached config is shared between callers and must be treated as
+// read-only.
 func LoadRouterModelConfigFromTOML(path string) (RouterModelConfig, error) {
-	raw, err := os.ReadFile(path)
+	abs, err := filepath.Abs(path)
+	if err != nil {
+		abs = path
+	}
+	info, err := os.Stat(abs)
+	if err != nil {
+		return RouterModelConfig{}, fmt.Errorf("read %s: %w", path, err)
+	}
+	tomlCacheMu.Lock()
+	entry, hit := tomlCache[abs]
+	tomlCacheMu.Unlock()
+	if hit && entry.modTime.Equal(info.ModTime()) && entry.size == info.Size() {
+		return entry.cfg, nil
+	}
+	cfg, err := parseRouterModelConfigTOML(abs, path)
+	if err != nil {
+		return RouterModelConfig{}, err
+	}
+	tomlCacheMu.Lock()
+	tomlCache[abs] = tomlCacheEntry{modTime: info.ModTime(), size: info.Size(), cfg: cfg}
+	tomlCacheMu.Unlock()
+	return cfg, nil
+}
+
+func parseRouterModelConfigTOML(abs string, path string) (RouterModelConfig, error) {
+	raw, err := os.ReadFile(abs)
 	if err != nil {
 		return RouterModelConfig{}, fmt.Errorf("read %s: %w", path, err)
 	}
@@ -69,10 +115,8 @@ func LoadRouterModelConfigFromTOML(path string) (RouterModelConfig, error) {
 
 func collectModelTables(data map[string]any) []any {
 	var out []any
-	if v, ok := data["models"]; ok {
-		if arr, ok := v.([]any); ok {
-			out = append(out, arr...)
-		}
+	if arr, ok := data["models"].([]any); ok {
+		out = append(out, arr...)
 	}
 	for k, v := range data {
 		if _, skip := reservedTOMLRoots[k]; skip {
@@ -82,10 +126,8 @@ func collectModelTables(data map[string]any) []any {
 		if !ok {
 			continue
 		}
-		if mm, ok := obj["models"]; ok {
-			if arr, ok := mm.([]any); ok {
-				out = append(out, arr...)
-			}
+		if arr, ok := obj["models"].([]any); ok {
+			out = append(out, arr...)
 		}
 	}
 	return out
@@ -8,6 +8,10 @@ import (
 	"github.com/jackc/pgx/v5/pgxpool"
 )
 
+// Connect opens a bounded pgx pool. MinConns keeps warm connections (and
+// their server-side prepared-statement caches) alive across idle periods so
+// request bursts do not pay reconnect latency; MaxConns caps fan-out to the
+// database.
 func Connect(ctx context.Context, dsn string) (*pgxpool.Pool, error) {
 	cfg, err := pgxpool.ParseConfig(dsn)
 	if err != nil {
@@ -64,6 +64,11 @@ func normalizeSQLitePath(raw string) string {
 	return trimmed
 }
 
+// ensureSchema creates missing tables and applies idempotent patches.
+// Enum-like columns (providers.type, monitor_invocations.status, auth_type)
+// are deliberately plain TEXT rather than native Postgres enum types: adding
+// a variant needs no DDL, and the values index and compare as ordinary
+// b-tree string keys.
 func ensureSchema(ctx context.Context, pool *pgxpool.Pool) error {
 	stmts := []string{
 		`CREATE TABLE IF NOT EXISTS go_bootstrap_migrations (
@@ -78,8 +83,8 @@ func ensureSchema(ctx context.Context, pool *pgxpool.Pool) error {
 			base_url TEXT,
 			api_key TEXT,
 			settings JSONB NOT NULL DEFAULT '{}'::jsonb,
-			created_at TIMESTAMPTZ,
-			updated_at TIMESTAMPTZ
+			created_at TIMESTAMPTZ DEFAULT now(),
+			updated_at TIMESTAMPTZ DEFAULT now()
 		)`,
 		`CREATE TABLE IF NOT EXISTS provider_oauth_credentials (
 			id BIGINT PRIMARY KEY,
@@ -93,12 +98,13 @@ func ensureSchema(ctx context.Context, pool *pgxpool.Pool) error {
 			api_key TEXT,
 			settings JSONB NOT NULL DEFAULT '{}'::jsonb,
 			expires_at TIMESTAMPTZ,
-			created_at TIMESTAMPTZ,
-			updated_at TIMESTAMPTZ
+			created_at TIMESTAMPTZ DEFAULT now(),
+			updated_at TIMESTAMPTZ DEFAULT now()
 		)`,
 		`CREATE TABLE IF NOT EXISTS api_keys (
 			id BIGINT PRIMARY KEY,
 			key TEXT UNIQUE,
+			key_hash TEXT,
 			name TEXT,
 			is_active BOOLEAN NOT NULL DEFAULT true,
 			expires_at TIMESTAMPTZ,
@@ -107,8 +113,8 @@ func ensureSchema(ctx context.Context, pool *pgxpool.Pool) error {
 			allowed_models JSONB,
 			allowed_providers JSONB,
 			parameter_limits JSONB,
-			created_at TIMESTAMPTZ,
-			updated_at TIMESTAMPTZ
+			created_at TIMESTAMPTZ DEFAULT now(),
+			updated_at TIMESTAMPTZ DEFAULT now()
 		)`,
 		`CREATE TABLE IF NOT EXISTS models (
 			id BIGINT PRIMARY KEY,
@@ -122,8 +128,8 @@ func ensureSchema(ctx context.Context, pool *pgxpool.Pool) error {
 			config JSONB NOT NULL DEFAULT '{}'::jsonb,
 			download_uri TEXT,
 			local_path TEXT,
-			created_at TIMESTAMPTZ,
-			updated_at TIMESTAMPTZ,
+			created_at TIMESTAMPTZ DEFAULT now(),
+			updated_at TIMESTAMPTZ DEFAULT now(),
 			UNIQUE(provider_id, name)
 		)`,
 		`CREATE TABLE IF NOT EXISTS model_tags (
@@ -140,6 +146,10 @@ func ensureSchema(ctx context.Context, pool *pgxpool.Pool) error {
 			notes TEXT,
 			config JSONB NOT NULL DEFAULT '{}'::jsonb
 		)`,
+		// Large blob columns (request_messages, raw_response, response_text)
+		// stay as JSONB/TEXT: Postgres TOAST already stores oversized values
+		// compressed out-of-line, so application-level compression would only
+		// make the rows opaque to the monitor frontend and SQL filters.
 		`CREATE TABLE IF NOT EXISTS monitor_invocations (
 			id BIGINT PRIMARY KEY,
 			model_id BIGINT NOT NULL,
@@ -167,7 +177,7 @@ func ensureSchema(ctx context.Context, pool *pgxpool.Pool) error {
 			total_tokens BIGINT,
 			cost DOUBLE PRECISION,
 			raw_response JSONB,
-			created_at TIMESTAMPTZ
+			created_at TIMESTAMPTZ DEFAULT now()
 		)`,
 		`CREATE TABLE IF NOT EXISTS api_key_usage_monthly (
 			api_key_id BIGINT NOT NULL REFERENCES api_keys(id) ON DELETE CASCADE,
@@ -225,14 +235,35 @@ func ensureSchema(ctx context.Context, pool *pgxpool.Pool) error {
 		`ALTER TABLE api_keys ADD COLUMN IF NOT EXISTS expires_at TIMESTAMPTZ`,
 		`ALTER TABLE api_keys ADD COLUMN IF NOT EXISTS quota_tokens_monthly BIGINT`,
 		`ALTER TABLE api_keys ADD COLUMN IF NOT EXISTS ip_allowlist JSONB`,
+		`ALTER TABLE api_keys ADD COLUMN IF NOT EXISTS key_hash TEXT`,
+		`UPDATE api_keys SET key_hash = encode(sha256(convert_to(key, 'UTF8')), 'hex')
+		 WHERE key IS NOT NULL AND key_hash IS NULL`,
+		`CREATE UNIQUE INDEX IF NOT EXISTS idx_api_keys_key_hash ON api_keys(key_hash) WHERE key_hash IS NOT NULL`,
 		`ALTER TABLE monitor_invocations ADD COLUMN IF NOT EXISTS api_key_id BIGINT`,
 		`ALTER TABLE monitor_invocations ADD COLUMN IF NOT EXISTS api_key_name TEXT`,
 		`ALTER TABLE monitor_invocations ADD COLUMN IF NOT EXISTS auth_type TEXT`,
 		`ALTER TABLE monitor_invocations ADD COLUMN IF NOT EXISTS first_token_ms DOUBLE PRECISION`,
 		`ALTER TABLE monitor_invocations ADD COLUMN IF NOT EXISTS stream_duration_ms DOUBLE PRECISION`,
 		`ALTER TABLE monitor_invocations ADD COLUMN IF NOT EXISTS stream_end_reason TEXT`,
+		// created_at/updated_at default to now() server-side so inserts that
+		// omit them never ship a client-supplied timestamp bind parameter.
+		`ALTER TABLE providers ALTER COLUMN created_at SET DEFAULT now()`,
+		`ALTER TABLE providers ALTER COLUMN updated_at SET DEFAULT now()`,
+		`ALTER TABLE provider_oauth_credentials ALTER COLUMN created_at SET DEFAULT now()`,
+		`ALTER TABLE provider_oauth_credentials ALTER COLUMN updated_at SET DEFAULT now()`,
+		`ALTER TABLE api_keys ALTER COLUMN created_at SET DEFAULT now()`,
+		`ALTER TABLE api_keys ALTER COLUMN updated_at SET DEFAULT now()`,
+		`ALTER TABLE models ALTER COLUMN created_at SET DEFAULT now()`,
+		`ALTER TABLE models ALTER COLUMN updated_at SET DEFAULT now()`,
+		`ALTER TABLE monitor_invocations ALTER COLUMN created_at SET DEFAULT now()`,
+		// monitor_invocations index set is deliberately minimal: api_key_id
+		// serves quota detail grouping, started_at serves pure time-range
+		// filters, and the (provider_name, model_name, started_at) composite
+		// covers the analytics aggregates. Additional per-column indexes only
+		// slow down the bulk SQLite import.
 		`CREATE INDEX IF NOT EXISTS idx_monitor_invocations_api_key_id ON monitor_invocations(api_key_id)`,
 		`CREATE INDEX IF NOT EXISTS idx_monitor_invocations_started_at ON monitor_invocations(started_at)`,
+		`CREATE INDEX IF NOT EXISTS idx_monitor_invocations_prov_model_time ON monitor_invocations(provider_name, model_name, started_at)`,
 		`CREATE INDEX IF NOT EXISTS idx_provider_model_catalog_cache_provider ON provider_model_catalog_cache(provider_name)`,
 		`CREATE INDEX IF NOT EXISTS idx_provider_oauth_credentials_provider_id ON provider_oauth_credentials(provider_id)`,
 		`CREATE UNIQUE INDEX IF NOT EXISTS uq_provider_oauth_default_active ON provider_oauth_credentials(provider_id) WHERE is_default = true AND is_active = true`,
@@ -529,15 +560,16 @@ func migrateAPIKeys(ctx context.Context, sdb *sql.DB, pool *pgxpool.Pool) error
 		}
 		_, err := pool.Exec(ctx, `
 			INSERT INTO api_keys (
-				id, key, name, is_active, allowed_models, allowed_providers, parameter_limits, created_at, updated_at
+				id, key, key_hash, name, is_active, allowed_models, allowed_providers, parameter_limits, created_at, updated_at
 			)
 			VALUES (
-				$1,$2,$3,$4,
+				$1,$2, encode(sha256(convert_to($2, 'UTF8')), 'hex'), $3,$4,
 				nullif($5,'')::jsonb, nullif($6,'')::jsonb, nullif($7,'')::jsonb,
 				nullif($8,''), nullif($9,'')
 			)
 			ON CONFLICT (id) DO UPDATE SET
 				key=EXCLUDED.key,
+				key_hash=EXCLUDED.key_hash,
 				name=EXCLUDED.name,
 				is_active=EXCLUDED.is_active,
 				allowed_models=EXCLUDED.allowed_models,
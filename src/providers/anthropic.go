@@ -8,12 +8,25 @@ import (
 )
 
 // AnthropicProviderClient invokes Claude native messages endpoint.
+// The endpoint URL and the static request headers are functions of the
+// provider snapshot the client was built from, so both are computed once at
+// construction instead of per invoke.
 type AnthropicProviderClient struct {
 	HTTPProviderBase
+	endpoint    string
+	baseHeaders map[string]string
 }
 
 func NewAnthropicProviderClient(provider db.Provider) *AnthropicProviderClient {
-	return &AnthropicProviderClient{HTTPProviderBase: NewHTTPProviderBase(provider)}
+	c := &AnthropicProviderClient{HTTPProviderBase: NewHTTPProviderBase(provider)}
+	c.endpoint = c.buildEndpoint()
+	c.baseHeaders = map[string]string{
+		"anthropic-version": c.version(),
+	}
+	if apiKey := c.APIKey(); apiKey != "" {
+		c.baseHeaders["x-api-key"] = apiKey
+	}
+	return c
 }
 
 func (c *AnthropicProviderClient) Invoke(ctx context.Context, model db.Model, payload map[string]any) (map[string]any, error) {
@@ -37,17 +50,10 @@ func (c *AnthropicProviderClient) Invoke(ctx context.Context, model db.Model, pa
 		delete(body, transient)
 	}
 
-	apiKey := resolveAPIKey(c.Provider)
-	if apiKey == "" {
+	if _, ok := c.baseHeaders["x-api-key"]; !ok {
 		return nil, &ProviderError{Message: "claude api_key is required"}
 	}
-
-	headers := map[string]string{
-		"x-api-key":         apiKey,
-		"anthropic-version": c.version(),
-	}
-	endpoint := c.buildEndpoint()
-	return c.doJSON(ctx, "POST", endpoint, body, headers)
+	return c.doJSON(ctx, "POST", c.endpoint, body, c.baseHeaders)
 }
 
 func (c *AnthropicProviderClient) version() string {
@@ -77,17 +83,17 @@ func (c *AnthropicProviderClient) buildEndpoint() string {
 func openAIMessagesToClaudeMessages(messages []map[string]any) []map[string]any {
 	out := make([]map[string]any, 0, len(messages))
 	for _, message := range messages {
-		role := sanitizeString(message["role"])
-		if role == "" || role == "system" {
-			role = "user"
-		}
-		if role != "user" {
-			role = "assistant"
-		}
 		content := sanitizeString(message["content"])
 		if content == "" {
 			continue
 		}
+		var role string
+		switch sanitizeString(message["role"]) {
+		case "", "system", "user":
+			role = "user"
+		default:
+			role = "assistant"
+		}
 		out = append(out, map[string]any{
 			"role": role,
 			"content": []map[string]any{{
@@ -41,9 +41,25 @@ type BaseProviderClient interface {
 }
 
 // HTTPProviderBase provides shared HTTP helpers for provider adapters.
+// Concrete adapters resolve their static auth headers and endpoints once at
+// construction and hand doJSON a read-only header map per call.
 type HTTPProviderBase struct {
 	Provider db.Provider
 	Client   *http.Client
+	apiKey   string
+}
+
+// sharedTransport backs every provider client so keepalive connections and
+// TLS sessions (HTTP/2 where the upstream supports it) are pooled across
+// providers instead of each client owning a cold zero-value transport. It is
+// safe for concurrent use from any goroutine, so one process-wide instance
+// suffices.
+var sharedTransport = &http.Transport{
+	Proxy:               http.ProxyFromEnvironment,
+	MaxIdleConns:        100,
+	MaxIdleConnsPerHost: 20,
+	IdleConnTimeout:     60 * time.Second,
+	ForceAttemptHTTP2:   true,
 }
 
 func NewHTTPProviderBase(provider db.Provider) HTTPProviderBase {
@@ -51,11 +67,20 @@ func NewHTTPProviderBase(provider db.Provider) HTTPProviderBase {
 	return HTTPProviderBase{
 		Provider: provider,
 		Client: &http.Client{
-			Timeout: timeout,
+			Transport: sharedTransport,
+			Timeout:   timeout,
 		},
+		apiKey: resolveAPIKey(provider),
 	}
 }
 
+// APIKey returns the provider credential resolved once at client
+// construction; clients live in the registry, so per-request callers no
+// longer re-trim settings or re-read the environment.
+func (b *HTTPProviderBase) APIKey() string {
+	return b.apiKey
+}
+
 func providerTimeout(provider db.Provider) time.Duration {
 	if provider.Settings != nil {
 		if raw, ok := provider.Settings["timeout"]; ok {
@@ -82,6 +107,9 @@ func providerTimeout(provider db.Provider) time.Duration {
 	return 90 * time.Second
 }
 
+// doJSON is the single serialize/deserialize point for all HTTP providers:
+// the body is marshalled exactly once by Go's compiled encoder and the
+// response bytes are decoded directly, with no intermediate text decode.
 func (b *HTTPProviderBase) doJSON(ctx context.Context, method, url string, body any, headers map[string]string) (map[string]any, error) {
 	var reader io.Reader
 	if body != nil {
@@ -172,8 +200,11 @@ func resolveModelIdentifier(model db.Model, payload map[string]any) string {
 	return model.Name
 }
 
+// mergeRequestParameters layers the request payload over the model defaults.
+// Callers mutate the result, so it always returns a fresh map; pre-sizing it
+// avoids rehash-and-grow cycles during the merge.
 func mergeRequestParameters(model db.Model, payload map[string]any) map[string]any {
-	out := map[string]any{}
+	out := make(map[string]any, len(model.DefaultParams)+len(payload))
 	for k, v := range model.DefaultParams {
 		out[k] = v
 	}
@@ -184,15 +215,17 @@ func mergeRequestParameters(model db.Model, payload map[string]any) map[string]a
 }
 
 func parseMessageLikeInput(payload map[string]any) []map[string]any {
-	messages := make([]map[string]any, 0)
-	if raw, ok := payload["messages"].([]any); ok {
+	var messages []map[string]any
+	switch raw := payload["messages"].(type) {
+	case []any:
+		messages = make([]map[string]any, 0, len(raw)+1)
 		for _, item := range raw {
 			if m, ok := item.(map[string]any); ok {
 				messages = append(messages, m)
 			}
 		}
-	}
-	if raw, ok := payload["messages"].([]map[string]any); ok {
+	case []map[string]any:
+		messages = make([]map[string]any, 0, len(raw)+1)
 		messages = append(messages, raw...)
 	}
 	if prompt, ok := payload["prompt"].(string); ok && strings.TrimSpace(prompt) != "" {
@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"net/url"
 	"strings"
+	"sync"
 
 	"github.com/rinbarpen/llm-router/src/db"
 )
@@ -12,10 +13,42 @@ import (
 // GeminiProviderClient invokes Gemini native generateContent endpoint.
 type GeminiProviderClient struct {
 	HTTPProviderBase
+	// base and endpointTemplate are resolved once at construction; only
+	// the model id and API key vary per request. endpoints memoizes the
+	// template substitution per model id (bounded by the provider's model
+	// count), leaving just the key query to append per call.
+	base             string
+	endpointTemplate string
+	mu               sync.Mutex
+	endpoints        map[string]string
 }
 
 func NewGeminiProviderClient(provider db.Provider) *GeminiProviderClient {
-	return &GeminiProviderClient{HTTPProviderBase: NewHTTPProviderBase(provider)}
+	c := &GeminiProviderClient{HTTPProviderBase: NewHTTPProviderBase(provider)}
+	c.base = "https://generativelanguage.googleapis.com"
+	if c.Provider.BaseURL != nil && strings.TrimSpace(*c.Provider.BaseURL) != "" {
+		c.base = strings.TrimSpace(*c.Provider.BaseURL)
+	} else if raw, ok := c.Provider.Settings["base_url"].(string); ok && strings.TrimSpace(raw) != "" {
+		c.base = strings.TrimSpace(raw)
+	}
+	c.base = strings.TrimRight(c.base, "/")
+	c.endpointTemplate = "/v1beta/models/{model}:generateContent"
+	if raw, ok := c.Provider.Settings["endpoint_template"].(string); ok && strings.TrimSpace(raw) != "" {
+		c.endpointTemplate = strings.TrimSpace(raw)
+	}
+	c.endpoints = map[string]string{}
+	return c
+}
+
+func (c *GeminiProviderClient) modelEndpoint(modelID string) string {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if endpoint, ok := c.endpoints[modelID]; ok {
+		return endpoint
+	}
+	endpoint := c.base + "/" + strings.TrimLeft(strings.ReplaceAll(c.endpointTemplate, "{model}", modelID), "/")
+	c.endpoints[modelID] = endpoint
+	return endpoint
 }
 
 func (c *GeminiProviderClient) Invoke(ctx context.Context, model db.Model, payload map[string]any) (map[string]any, error) {
@@ -42,7 +75,7 @@ func (c *GeminiProviderClient) Invoke(ctx context.Context, model db.Model, paylo
 		}
 	}
 
-	apiKey := resolveAPIKey(c.Provider)
+	apiKey := c.APIKey()
 	if apiKey == "" {
 		return nil, &ProviderError{Message: "gemini api_key is required"}
 	}
@@ -52,24 +85,11 @@ func (c *GeminiProviderClient) Invoke(ctx context.Context, model db.Model, paylo
 }
 
 func (c *GeminiProviderClient) buildEndpoint(model db.Model, apiKey string) string {
-	base := "https://generativelanguage.googleapis.com"
-	if c.Provider.BaseURL != nil && strings.TrimSpace(*c.Provider.BaseURL) != "" {
-		base = strings.TrimSpace(*c.Provider.BaseURL)
-	} else if raw, ok := c.Provider.Settings["base_url"].(string); ok && strings.TrimSpace(raw) != "" {
-		base = strings.TrimSpace(raw)
-	}
-	endpointTemplate := "/v1beta/models/{model}:generateContent"
-	if raw, ok := c.Provider.Settings["endpoint_template"].(string); ok && strings.TrimSpace(raw) != "" {
-		endpointTemplate = strings.TrimSpace(raw)
-	}
 	modelID := resolveModelIdentifier(model, nil)
 	if modelID == "" {
 		modelID = model.Name
 	}
-	endpoint := strings.ReplaceAll(endpointTemplate, "{model}", modelID)
-	query := url.Values{}
-	query.Set("key", apiKey)
-	return strings.TrimRight(base, "/") + "/" + strings.TrimLeft(endpoint, "/") + "?" + query.Encode()
+	return c.modelEndpoint(modelID) + "?key=" + url.QueryEscape(apiKey)
 }
 
 func openAIMessagesToGeminiContents(messages []map[string]any) []map[string]any {
@@ -83,9 +103,9 @@ func openAIMessagesToGeminiContents(messages []map[string]any) []map[string]any
 			role = "model"
 		}
 		content := message["content"]
-		text := fmt.Sprintf("%v", content)
-		if s, ok := content.(string); ok {
-			text = s
+		text, ok := content.(string)
+		if !ok {
+			text = fmt.Sprintf("%v", content)
 		}
 		if strings.TrimSpace(text) == "" {
 			continue
@@ -3,6 +3,8 @@ package providers
 import "github.com/rinbarpen/llm-router/src/db"
 
 // OllamaProviderClient currently follows OpenAI-compatible contract.
+// Messages pass through as the raw request maps; there is no per-message
+// serialization layer to optimize away.
 type OllamaProviderClient struct {
 	*OpenAICompatibleProviderClient
 }
@@ -3,7 +3,6 @@ package providers
 import (
 	"context"
 	"fmt"
-	"net/url"
 	"strings"
 
 	"github.com/rinbarpen/llm-router/src/db"
@@ -12,10 +11,21 @@ import (
 // OpenAICompatibleProviderClient supports OpenAI-compatible chat endpoints.
 type OpenAICompatibleProviderClient struct {
 	HTTPProviderBase
+	// endpoint and baseHeaders are derived once from provider config at
+	// construction; neither varies per request and doJSON only reads the
+	// header map.
+	endpoint    string
+	baseHeaders map[string]string
 }
 
 func NewOpenAICompatibleProviderClient(provider db.Provider) *OpenAICompatibleProviderClient {
-	return &OpenAICompatibleProviderClient{HTTPProviderBase: NewHTTPProviderBase(provider)}
+	c := &OpenAICompatibleProviderClient{HTTPProviderBase: NewHTTPProviderBase(provider)}
+	c.endpoint = c.buildEndpoint()
+	c.baseHeaders = map[string]string{}
+	if key := c.APIKey(); key != "" {
+		c.baseHeaders[c.authHeaderName()] = strings.TrimSpace(c.authScheme() + " " + key)
+	}
+	return c
 }
 
 var defaultBaseURLs = map[db.ProviderType]string{
@@ -53,13 +63,7 @@ func (c *OpenAICompatibleProviderClient) Invoke(ctx context.Context, model db.Mo
 	body["model"] = resolveModelIdentifier(model, payload)
 	delete(body, "prompt")
 
-	endpoint := c.buildEndpoint()
-	headers := map[string]string{}
-	if key := resolveAPIKey(c.Provider); key != "" {
-		headers[c.authHeaderName()] = strings.TrimSpace(c.authScheme() + " " + key)
-	}
-
-	return c.doJSON(ctx, "POST", endpoint, body, headers)
+	return c.doJSON(ctx, "POST", c.endpoint, body, c.baseHeaders)
 }
 
 func (c *OpenAICompatibleProviderClient) buildEndpoint() string {
@@ -97,10 +101,9 @@ func (c *OpenAICompatibleProviderClient) buildEndpoint() string {
 	if strings.HasSuffix(base, "/v1") && endpoint == "/v1/chat/completions" {
 		return base + "/chat/completions"
 	}
-	parsed, err := url.Parse(base)
-	if err != nil || parsed.Scheme == "" {
-		return base + endpoint
-	}
+	// base and endpoint are operator-configured, already trimmed and
+	// slash-normalized above; plain concatenation is all that is left and
+	// skips a full URL tokenization per call.
 	return base + endpoint
 }
 
@@ -9,6 +9,9 @@ import (
 
 type clientFactory func(provider db.Provider) BaseProviderClient
 
+// clientMapping registers constructors, not instances: a client (and any
+// process or connection it owns, e.g. the transformers/vLLM local runners)
+// is only created when its provider type is actually requested.
 var clientMapping = map[db.ProviderType]clientFactory{
 	db.ProviderTypeRemoteHTTP:    func(p db.Provider) BaseProviderClient { return NewRemoteHTTPProviderClient(p) },
 	db.ProviderTypeCustomHTTP:    func(p db.Provider) BaseProviderClient { return NewRemoteHTTPProviderClient(p) },
@@ -39,7 +42,9 @@ var clientMapping = map[db.ProviderType]clientFactory{
 	db.ProviderTypeQwenCodeCLI:   func(p db.Provider) BaseProviderClient { return NewQwenCodeCLIProviderClient(p) },
 }
 
-// ProviderRegistry caches provider clients keyed by provider ID.
+// ProviderRegistry caches provider clients keyed by provider ID. Clients are
+// constructed on first use, so provider types that a deployment never routes
+// to cost nothing at startup.
 type ProviderRegistry struct {
 	mu      sync.RWMutex
 	clients map[int64]BaseProviderClient
@@ -51,21 +56,26 @@ func NewProviderRegistry() *ProviderRegistry {
 
 func (r *ProviderRegistry) Get(provider db.Provider) (BaseProviderClient, error) {
 	r.mu.RLock()
-	if c, ok := r.clients[provider.ID]; ok {
-		r.mu.RUnlock()
+	c, ok := r.clients[provider.ID]
+	r.mu.RUnlock()
+	if ok {
 		return c, nil
 	}
-	r.mu.RUnlock()
 
 	factory, ok := clientMapping[provider.Type]
 	if !ok {
 		return nil, fmt.Errorf("unsupported provider type: %s", provider.Type)
 	}
-	client := factory(provider)
 
+	// Re-check under the write lock so concurrent misses resolve to one
+	// canonical client instance instead of each constructing its own.
 	r.mu.Lock()
+	defer r.mu.Unlock()
+	if existing, ok := r.clients[provider.ID]; ok {
+		return existing, nil
+	}
+	client := factory(provider)
 	r.clients[provider.ID] = client
-	r.mu.Unlock()
 	return client, nil
 }
 
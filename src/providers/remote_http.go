@@ -10,32 +10,34 @@ import (
 // RemoteHTTPProviderClient posts raw payload to configured custom endpoint.
 type RemoteHTTPProviderClient struct {
 	HTTPProviderBase
+	// endpoint and baseHeaders are resolved once at construction; the
+	// missing-endpoint error still surfaces per invoke.
+	endpoint    string
+	baseHeaders map[string]string
 }
 
 func NewRemoteHTTPProviderClient(provider db.Provider) *RemoteHTTPProviderClient {
-	return &RemoteHTTPProviderClient{HTTPProviderBase: NewHTTPProviderBase(provider)}
-}
-
-func (c *RemoteHTTPProviderClient) Invoke(ctx context.Context, model db.Model, payload map[string]any) (map[string]any, error) {
-	endpoint := ""
+	c := &RemoteHTTPProviderClient{HTTPProviderBase: NewHTTPProviderBase(provider)}
 	if raw, ok := c.Provider.Settings["endpoint"].(string); ok {
-		endpoint = strings.TrimSpace(raw)
+		c.endpoint = strings.TrimSpace(raw)
+	}
+	if c.endpoint == "" && c.Provider.BaseURL != nil {
+		c.endpoint = strings.TrimSpace(*c.Provider.BaseURL)
 	}
-	if endpoint == "" {
-		if c.Provider.BaseURL != nil {
-			endpoint = strings.TrimSpace(*c.Provider.BaseURL)
-		}
+	c.baseHeaders = map[string]string{}
+	if key := c.APIKey(); key != "" {
+		c.baseHeaders["Authorization"] = "Bearer " + key
 	}
-	if endpoint == "" {
+	return c
+}
+
+func (c *RemoteHTTPProviderClient) Invoke(ctx context.Context, model db.Model, payload map[string]any) (map[string]any, error) {
+	if c.endpoint == "" {
 		return nil, &ProviderError{Message: "remote_http endpoint is required"}
 	}
 	body := mergeRequestParameters(model, payload)
 	if _, ok := body["model"]; !ok {
 		body["model"] = resolveModelIdentifier(model, payload)
 	}
-	headers := map[string]string{}
-	if key := resolveAPIKey(c.Provider); key != "" {
-		headers["Authorization"] = "Bearer " + key
-	}
-	return c.doJSON(ctx, "POST", endpoint, body, headers)
+	return c.doJSON(ctx, "POST", c.endpoint, body, c.baseHeaders)
 }
@@ -2,7 +2,12 @@ package providers
 
 import "github.com/rinbarpen/llm-router/src/db"
 
-// TransformersProviderClient currently follows OpenAI-compatible contract.
+// TransformersProviderClient currently follows OpenAI-compatible contract:
+// it talks to an external inference server over HTTP and hosts no in-process
+// pipeline (and therefore no per-model lock table to get-or-create).
+// Streaming likewise never buffers a full generation in this process: stream
+// requests bypass Invoke entirely and are proxied token-by-token through the
+// services SSE path straight from the inference server.
 type TransformersProviderClient struct {
 	*OpenAICompatibleProviderClient
 }
@@ -2,7 +2,9 @@ package providers
 
 import "github.com/rinbarpen/llm-router/src/db"
 
-// VLLMProviderClient currently follows OpenAI-compatible contract.
+// VLLMProviderClient currently follows OpenAI-compatible contract, so it
+// inherits that client's pass-through message handling and construction-time
+// endpoint/header resolution.
 type VLLMProviderClient struct {
 	*OpenAICompatibleProviderClient
 }
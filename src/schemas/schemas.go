@@ -1,3 +1,7 @@
+// Package schemas holds the plain wire/DB structs for the service. They are
+// decoded by encoding/json's cached per-type decoders with no per-field
+// callback hooks, so request validation cost is the decode itself; semantic
+// checks live in the services layer.
 package schemas
 
 import "time"
@@ -81,6 +85,9 @@ type OpenAIModelObject struct {
 	OwnedBy string `json:"owned_by"`
 }
 
+// APIKey is both the row shape and the response shape: queries scan straight
+// into it and the jsonb columns unmarshal into its list/map fields, so there
+// is no ORM-object-to-DTO conversion step on list or validate paths.
 type APIKey struct {
 	ID               int64          `json:"id"`
 	Key              *string        `json:"key,omitempty"`
@@ -122,6 +129,12 @@ type LoginRequest struct {
 	APIKey string `json:"api_key"`
 }
 
+type LoginResponse struct {
+	SessionToken string `json:"session_token"`
+	APIKeyID     int64  `json:"api_key_id"`
+	Message      string `json:"message"`
+}
+
 type OAuthAccount struct {
 	ID           int64          `json:"id"`
 	ProviderID   int64          `json:"provider_id"`
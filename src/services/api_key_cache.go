@@ -0,0 +1,87 @@
+package services
+
+import (
+	"context"
+	"sync"
+	"time"
+
+	"github.com/rinbarpen/llm-router/src/schemas"
+)
+
+// apiKeyCacheTTL bounds how long a validated key is served without re-reading
+// the database. Revocations through this process clear the cache immediately;
+// revocations made by another instance take effect within one TTL.
+const apiKeyCacheTTL = 60 * time.Second
+
+type apiKeyCacheEntry struct {
+	expiresAt time.Time
+	item      schemas.APIKey
+}
+
+type apiKeyLookup struct {
+	done chan struct{}
+	item schemas.APIKey
+	err  error
+}
+
+// apiKeyCache caches successful key validations by key hash and coalesces
+// concurrent lookups of the same hash into one query, so the per-request auth
+// check stops being one database round trip per request under steady traffic.
+// Failed lookups are never cached: a just-created key must work on first use.
+type apiKeyCache struct {
+	mu      sync.Mutex
+	entries map[string]apiKeyCacheEntry
+	flight  map[string]*apiKeyLookup
+}
+
+func newAPIKeyCache() *apiKeyCache {
+	return &apiKeyCache{
+		entries: map[string]apiKeyCacheEntry{},
+		flight:  map[string]*apiKeyLookup{},
+	}
+}
+
+func (c *apiKeyCache) lookup(ctx context.Context, hash string, fn func() (schemas.APIKey, error)) (schemas.APIKey, error) {
+	c.mu.Lock()
+	if entry, ok := c.entries[hash]; ok {
+		if time.Now().Before(entry.expiresAt) {
+			c.mu.Unlock()
+			return entry.item, nil
+		}
+		delete(c.entries, hash)
+	}
+	if call, ok := c.flight[hash]; ok {
+		c.mu.Unlock()
+		select {
+		case <-call.done:
+			return call.item, call.err
+		case <-ctx.Done():
+			return schemas.APIKey{}, ctx.Err()
+		}
+	}
+	call := &apiKeyLookup{done: make(chan struct{})}
+	c.flight[hash] = call
+	c.mu.Unlock()
+
+	call.item, call.err = fn()
+
+	c.mu.Lock()
+	delete(c.flight, hash)
+	if call.err == nil {
+		c.entries[hash] = apiKeyCacheEntry{expiresAt: time.Now().Add(apiKeyCacheTTL), item: call.item}
+	}
+	c.mu.Unlock()
+	close(call.done)
+	return call.item, call.err
+}
+
+// clear drops every cached validation; mutation paths call it so key edits,
+// revocations, and TOML imports are visible on the next request.
+func (c *apiKeyCache) clear() {
+	if c == nil {
+		return
+	}
+	c.mu.Lock()
+	c.entries = map[string]apiKeyCacheEntry{}
+	c.mu.Unlock()
+}
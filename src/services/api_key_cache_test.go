@@ -0,0 +1,98 @@
+package services
+
+import (
+	"context"
+	"errors"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"github.com/rinbarpen/llm-router/src/schemas"
+)
+
+func TestAPIKeyCacheCachesSuccessOnly(t *testing.T) {
+	cache := newAPIKeyCache()
+	var calls int32
+	lookup := func() (schemas.APIKey, error) {
+		atomic.AddInt32(&calls, 1)
+		return schemas.APIKey{ID: 7}, nil
+	}
+
+	item, err := cache.lookup(context.Background(), "hash-a", lookup)
+	if err != nil || item.ID != 7 {
+		t.Fatalf("first lookup = (%v, %v), want item 7", item.ID, err)
+	}
+	if _, err := cache.lookup(context.Background(), "hash-a", lookup); err != nil {
+		t.Fatalf("cached lookup returned error: %v", err)
+	}
+	if got := atomic.LoadInt32(&calls); got != 1 {
+		t.Fatalf("db lookups = %d, want 1 (second hit should come from cache)", got)
+	}
+
+	wantErr := errors.New("no such key")
+	failing := func() (schemas.APIKey, error) {
+		atomic.AddInt32(&calls, 1)
+		return schemas.APIKey{}, wantErr
+	}
+	for i := 0; i < 2; i++ {
+		if _, err := cache.lookup(context.Background(), "hash-bad", failing); !errors.Is(err, wantErr) {
+			t.Fatalf("failing lookup %d err = %v, want %v", i, err, wantErr)
+		}
+	}
+	if got := atomic.LoadInt32(&calls); got != 3 {
+		t.Fatalf("db lookups = %d, want 3 (failures must not be cached)", got)
+	}
+}
+
+func TestAPIKeyCacheClearForcesRefresh(t *testing.T) {
+	cache := newAPIKeyCache()
+	var calls int32
+	lookup := func() (schemas.APIKey, error) {
+		atomic.AddInt32(&calls, 1)
+		return schemas.APIKey{ID: 1}, nil
+	}
+	if _, err := cache.lookup(context.Background(), "hash", lookup); err != nil {
+		t.Fatalf("lookup returned error: %v", err)
+	}
+	cache.clear()
+	if _, err := cache.lookup(context.Background(), "hash", lookup); err != nil {
+		t.Fatalf("lookup after clear returned error: %v", err)
+	}
+	if got := atomic.LoadInt32(&calls); got != 2 {
+		t.Fatalf("db lookups = %d, want 2 after clear", got)
+	}
+	var nilCache *apiKeyCache
+	nilCache.clear()
+}
+
+func TestAPIKeyCacheCoalescesConcurrentLookups(t *testing.T) {
+	cache := newAPIKeyCache()
+	var calls int32
+	release := make(chan struct{})
+
+	var wg sync.WaitGroup
+	for i := 0; i < 4; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			item, err := cache.lookup(context.Background(), "same-hash", func() (schemas.APIKey, error) {
+				atomic.AddInt32(&calls, 1)
+				<-release
+				return schemas.APIKey{ID: 42}, nil
+			})
+			if err != nil || item.ID != 42 {
+				t.Errorf("lookup = (%v, %v), want item 42", item.ID, err)
+			}
+		}()
+	}
+	// Give followers a moment to park on the in-flight lookup, then let the
+	// leader finish.
+	time.Sleep(100 * time.Millisecond)
+	close(release)
+	wg.Wait()
+
+	if got := atomic.LoadInt32(&calls); got != 1 {
+		t.Fatalf("db lookups = %d, want 1", got)
+	}
+}
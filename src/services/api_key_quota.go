@@ -55,17 +55,15 @@ func (s *CatalogService) AccumulateAPIKeyUsage(ctx context.Context, apiKeyID int
 	if cost < 0 {
 		cost = 0
 	}
-	_, err := s.pool.Exec(ctx, `
-		INSERT INTO api_key_usage_monthly(api_key_id, year_month, total_tokens, total_requests, total_cost, updated_at)
-		VALUES($1, $2, $3, 1, $4, now())
-		ON CONFLICT(api_key_id, year_month) DO UPDATE SET
-			total_tokens = api_key_usage_monthly.total_tokens + EXCLUDED.total_tokens,
-			total_requests = api_key_usage_monthly.total_requests + 1,
-			total_cost = api_key_usage_monthly.total_cost + EXCLUDED.total_cost,
-			updated_at = now()
-	`, apiKeyID, yearMonth(time.Now()), tokens, cost)
-	if err != nil {
-		return fmt.Errorf("accumulate api key usage: %w", err)
-	}
+	s.usageBuf.add(apiKeyID, yearMonth(time.Now()), tokens, cost)
 	return nil
 }
+
+// FlushUsage drains buffered usage counters to the database immediately.
+// Called on shutdown so the final accumulator interval is not lost.
+func (s *CatalogService) FlushUsage(ctx context.Context) {
+	if s == nil || s.usageBuf == nil {
+		return
+	}
+	s.usageBuf.flush(ctx)
+}
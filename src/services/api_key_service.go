@@ -1,26 +1,37 @@
 package services
 
 import (
+	"crypto/sha256"
+	"encoding/hex"
 	"strings"
 
 	"github.com/rinbarpen/llm-router/src/schemas"
 )
 
+// hashAPIKey returns the hex SHA-256 digest stored in api_keys.key_hash;
+// auth lookups compare fixed-width digests instead of variable-length keys.
+func hashAPIKey(key string) string {
+	sum := sha256.Sum256([]byte(key))
+	return hex.EncodeToString(sum[:])
+}
+
 // APIKeyPolicy is a runtime authorization helper derived from DB api key rows.
+// The allowlists are folded into sets once at construction so IsModelAllowed
+// is a pair of map lookups per request.
 type APIKeyPolicy struct {
 	Key              string
 	Name             string
 	IsActive         bool
-	AllowedModels    []string
-	AllowedProviders []string
+	AllowedModels    map[string]struct{}
+	AllowedProviders map[string]struct{}
 	ParameterLimits  map[string]any
 }
 
 func NewAPIKeyPolicy(item schemas.APIKey) APIKeyPolicy {
 	policy := APIKeyPolicy{
 		IsActive:         item.IsActive,
-		AllowedModels:    normalizeList(item.AllowedModels),
-		AllowedProviders: normalizeList(item.AllowedProviders),
+		AllowedModels:    foldSet(item.AllowedModels),
+		AllowedProviders: foldSet(item.AllowedProviders),
 		ParameterLimits:  item.ParameterLimits,
 	}
 	if item.Key != nil {
@@ -36,37 +47,34 @@ func (p APIKeyPolicy) IsModelAllowed(providerName string, modelName string) bool
 	if !p.IsActive {
 		return false
 	}
-	providerName = strings.TrimSpace(providerName)
-	modelName = strings.TrimSpace(modelName)
-	if len(p.AllowedProviders) > 0 && !containsIgnoreCase(p.AllowedProviders, providerName) {
-		return false
+	providerName = strings.ToLower(strings.TrimSpace(providerName))
+	modelName = strings.ToLower(strings.TrimSpace(modelName))
+	if len(p.AllowedProviders) > 0 {
+		if _, ok := p.AllowedProviders[providerName]; !ok {
+			return false
+		}
 	}
 	if len(p.AllowedModels) == 0 {
 		return true
 	}
-	if containsIgnoreCase(p.AllowedModels, modelName) {
+	if _, ok := p.AllowedModels[modelName]; ok {
 		return true
 	}
-	compound := providerName + "/" + modelName
-	return containsIgnoreCase(p.AllowedModels, compound)
+	_, ok := p.AllowedModels[providerName+"/"+modelName]
+	return ok
 }
 
-func normalizeList(items []string) []string {
-	out := make([]string, 0, len(items))
-	for _, item := range items {
-		if v := strings.TrimSpace(item); v != "" {
-			out = append(out, v)
-		}
+// foldSet trims, lowercases and drops empty entries, returning a membership
+// set; nil when the source list is empty so len() keeps meaning "no restriction".
+func foldSet(items []string) map[string]struct{} {
+	if len(items) == 0 {
+		return nil
 	}
-	return out
-}
-
-func containsIgnoreCase(items []string, target string) bool {
-	target = strings.ToLower(strings.TrimSpace(target))
+	out := make(map[string]struct{}, len(items))
 	for _, item := range items {
-		if strings.ToLower(strings.TrimSpace(item)) == target {
-			return true
+		if v := strings.ToLower(strings.TrimSpace(item)); v != "" {
+			out[v] = struct{}{}
 		}
 	}
-	return false
+	return out
 }
@@ -3,7 +3,6 @@ package services
 import (
 	"context"
 	"encoding/json"
-	"errors"
 	"fmt"
 	"strings"
 
@@ -14,6 +13,10 @@ import (
 )
 
 // SyncRouterTOML upserts providers and models from router.toml into PostgreSQL (OpenAI-style catalog).
+// All upserts for one sync are queued into a single pgx.Batch so the whole
+// config lands in one round trip per phase instead of one per row. The whole
+// sync runs in one transaction — the provider phase is only separated so the
+// model phase can look up generated provider ids, not to commit early.
 func (s *CatalogService) SyncRouterTOML(ctx context.Context, configPath string) error {
 	cfg, err := config.LoadRouterModelConfigFromTOML(configPath)
 	if err != nil {
@@ -26,40 +29,105 @@ func (s *CatalogService) SyncRouterTOML(ctx context.Context, configPath string)
 	}
 	defer func() { _ = tx.Rollback(ctx) }()
 
+	providerBatch := &pgx.Batch{}
+	providerLabels := make([]string, 0, len(cfg.Providers))
 	for _, p := range cfg.Providers {
 		if strings.TrimSpace(p.Name) == "" || strings.TrimSpace(p.Type) == "" {
 			continue
 		}
-		if err := upsertProviderFromConfig(ctx, tx, p); err != nil {
+		if err := queueProviderUpsert(providerBatch, p); err != nil {
 			return err
 		}
+		providerLabels = append(providerLabels, p.Name)
+	}
+	if err := sendUpsertBatch(ctx, tx, providerBatch, "upsert provider", providerLabels); err != nil {
+		return err
 	}
 
+	providerIDs, err := providerIDsByName(ctx, tx)
+	if err != nil {
+		return err
+	}
+
+	batch := &pgx.Batch{}
+	labels := make([]string, 0, len(cfg.Models)+len(cfg.APIKeys))
 	for _, m := range cfg.Models {
 		if strings.TrimSpace(m.Name) == "" || strings.TrimSpace(m.Provider) == "" {
 			continue
 		}
-		if err := upsertModelFromConfig(ctx, tx, m); err != nil {
+		providerID, ok := providerIDs[m.Provider]
+		if !ok {
+			return fmt.Errorf("model %q: unknown provider %q", m.Name, m.Provider)
+		}
+		if err := queueModelUpsert(batch, providerID, m); err != nil {
 			return err
 		}
+		labels = append(labels, fmt.Sprintf("upsert model %q/%q", m.Provider, m.Name))
 	}
 	for _, k := range cfg.APIKeys {
 		resolved := k.ResolvedKey()
 		if resolved == nil || strings.TrimSpace(*resolved) == "" {
 			continue
 		}
-		if err := upsertAPIKeyFromConfig(ctx, tx, k, strings.TrimSpace(*resolved)); err != nil {
+		if err := queueAPIKeyUpsert(batch, k, strings.TrimSpace(*resolved)); err != nil {
 			return err
 		}
+		labels = append(labels, "upsert api key")
+	}
+	if err := sendUpsertBatch(ctx, tx, batch, "", labels); err != nil {
+		return err
 	}
 
 	if err := tx.Commit(ctx); err != nil {
 		return fmt.Errorf("commit sync: %w", err)
 	}
+	s.keyCache.clear()
 	return nil
 }
 
-func upsertProviderFromConfig(ctx context.Context, tx pgx.Tx, provider config.ProviderConfig) error {
+// sendUpsertBatch executes the queued statements in one round trip, mapping
+// the first failure back to the row label it belongs to.
+func sendUpsertBatch(ctx context.Context, tx pgx.Tx, batch *pgx.Batch, prefix string, labels []string) error {
+	if batch.Len() == 0 {
+		return nil
+	}
+	results := tx.SendBatch(ctx, batch)
+	defer results.Close()
+	for _, label := range labels {
+		if _, err := results.Exec(); err != nil {
+			if prefix != "" {
+				return fmt.Errorf("%s %q: %w", prefix, label, err)
+			}
+			return fmt.Errorf("%s: %w", label, err)
+		}
+	}
+	return results.Close()
+}
+
+func providerIDsByName(ctx context.Context, tx pgx.Tx) (map[string]int64, error) {
+	rows, err := tx.Query(ctx, `SELECT id, name FROM providers`)
+	if err != nil {
+		return nil, fmt.Errorf("load provider ids: %w", err)
+	}
+	defer rows.Close()
+	out := map[string]int64{}
+	for rows.Next() {
+		var (
+			id   int64
+			name string
+		)
+		if err := rows.Scan(&id, &name); err != nil {
+			return nil, fmt.Errorf("scan provider id: %w", err)
+		}
+		out[name] = id
+	}
+	if rows.Err() != nil {
+		return nil, fmt.Errorf("iterate provider ids: %w", rows.Err())
+	}
+	return out, nil
+}
+
+func queueProviderUpsert(batch *pgx.Batch, provider config.ProviderConfig) error {
 	settings := provider.Settings
 	if settings == nil {
 		settings = map[string]any{}
@@ -77,7 +145,7 @@ func upsertProviderFromConfig(ctx context.Context, tx pgx.Tx, provider config.Pr
 	if apiKey != nil {
 		apiKeyVal = *apiKey
 	}
-	_, err = tx.Exec(ctx, `
+	batch.Queue(`
 		INSERT INTO providers(id, name, type, is_active, base_url, api_key, settings, created_at, updated_at)
 		VALUES (
 			(SELECT COALESCE(MAX(id), 0) + 1 FROM providers),
@@ -91,21 +159,10 @@ func upsertProviderFromConfig(ctx context.Context, tx pgx.Tx, provider config.Pr
 			settings = EXCLUDED.settings,
 			updated_at = now()
 	`, provider.Name, provider.Type, provider.IsActive, baseURL, apiKeyVal, string(settingsRaw))
-	if err != nil {
-		return fmt.Errorf("upsert provider %q: %w", provider.Name, err)
-	}
 	return nil
 }
 
-func upsertModelFromConfig(ctx context.Context, tx pgx.Tx, m config.ModelConfigEntry) error {
-	var providerID int64
-	if err := tx.QueryRow(ctx, `SELECT id FROM providers WHERE name = $1`, m.Provider).Scan(&providerID); err != nil {
-		if errors.Is(err, pgx.ErrNoRows) {
-			return fmt.Errorf("model %q: unknown provider %q", m.Name, m.Provider)
-		}
-		return fmt.Errorf("lookup provider %q: %w", m.Provider, err)
-	}
-
+func queueModelUpsert(batch *pgx.Batch, providerID int64, m config.ModelConfigEntry) error {
 	defaultParams := m.DefaultParams
 	if defaultParams == nil {
 		defaultParams = map[string]any{}
@@ -148,7 +205,7 @@ func upsertModelFromConfig(ctx context.Context, tx pgx.Tx, m config.ModelConfigE
 		localPath = *m.LocalPath
 	}
 
-	_, err = tx.Exec(ctx, `
+	batch.Queue(`
 		INSERT INTO models (
 			id, provider_id, name, display_name, description, is_active,
 			remote_identifier, default_params, config, download_uri, local_path, created_at, updated_at
@@ -168,9 +225,6 @@ func upsertModelFromConfig(ctx context.Context, tx pgx.Tx, m config.ModelConfigE
 			local_path = EXCLUDED.local_path,
 			updated_at = now()
 	`, providerID, m.Name, displayName, description, m.IsActive, remoteID, string(defaultRaw), string(configRaw), downloadURI, localPath)
-	if err != nil {
-		return fmt.Errorf("upsert model %q/%q: %w", m.Provider, m.Name, err)
-	}
 	return nil
 }
 
@@ -185,7 +239,7 @@ func cloneAnyMap(m map[string]any) map[string]any {
 	return out
 }
 
-func upsertAPIKeyFromConfig(ctx context.Context, tx pgx.Tx, item config.APIKeyConfig, resolvedKey string) error {
+func queueAPIKeyUpsert(batch *pgx.Batch, item config.APIKeyConfig, resolvedKey string) error {
 	allowedModelsRaw, err := json.Marshal(item.AllowedModels)
 	if err != nil {
 		return fmt.Errorf("marshal api key allowed_models: %w", err)
@@ -213,16 +267,17 @@ func upsertAPIKeyFromConfig(ctx context.Context, tx pgx.Tx, item config.APIKeyCo
 	if err != nil {
 		return fmt.Errorf("marshal api key parameter_limits: %w", err)
 	}
-	_, err = tx.Exec(ctx, `
+	batch.Queue(`
 		INSERT INTO api_keys(
-			id, key, name, is_active, expires_at, quota_tokens_monthly, ip_allowlist,
+			id, key, key_hash, name, is_active, expires_at, quota_tokens_monthly, ip_allowlist,
 			allowed_models, allowed_providers, parameter_limits, created_at, updated_at
 		)
 		VALUES(
 			(SELECT COALESCE(MAX(id), 0) + 1 FROM api_keys),
-			$1,$2,$3,$4,$5,$6::jsonb,$7::jsonb,$8::jsonb,$9::jsonb,now(),now()
+			$1,$2,$3,$4,$5,$6,$7::jsonb,$8::jsonb,$9::jsonb,$10::jsonb,now(),now()
 		)
 		ON CONFLICT (key) DO UPDATE SET
+			key_hash = EXCLUDED.key_hash,
 			name = EXCLUDED.name,
 			is_active = EXCLUDED.is_active,
 			expires_at = EXCLUDED.expires_at,
@@ -232,10 +287,7 @@ func upsertAPIKeyFromConfig(ctx context.Context, tx pgx.Tx, item config.APIKeyCo
 			allowed_providers = EXCLUDED.allowed_providers,
 			parameter_limits = EXCLUDED.parameter_limits,
 			updated_at = now()
-	`, resolvedKey, item.Name, item.IsActive, item.ExpiresAt, item.QuotaTokensMonth, string(ipAllowlistRaw), string(allowedModelsRaw), string(allowedProvidersRaw), string(parameterLimitsRaw))
-	if err != nil {
-		return fmt.Errorf("upsert api key: %w", err)
-	}
+	`, resolvedKey, hashAPIKey(resolvedKey), item.Name, item.IsActive, item.ExpiresAt, item.QuotaTokensMonth, string(ipAllowlistRaw), string(allowedModelsRaw), string(allowedProvidersRaw), string(parameterLimitsRaw))
 	return nil
 }
 
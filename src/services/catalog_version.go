@@ -0,0 +1,30 @@
+package services
+
+import (
+	"context"
+	"fmt"
+	"time"
+)
+
+// ProviderListVersion returns the row count and newest updated_at for providers,
+// used by the API layer to build cache validators for the list endpoint.
+func (s *CatalogService) ProviderListVersion(ctx context.Context) (int64, *time.Time, error) {
+	return s.collectionVersion(ctx, "providers")
+}
+
+// ModelListVersion mirrors ProviderListVersion for the models table.
+func (s *CatalogService) ModelListVersion(ctx context.Context) (int64, *time.Time, error) {
+	return s.collectionVersion(ctx, "models")
+}
+
+func (s *CatalogService) collectionVersion(ctx context.Context, table string) (int64, *time.Time, error) {
+	var (
+		count   int64
+		updated *time.Time
+	)
+	query := fmt.Sprintf("SELECT COUNT(id), MAX(updated_at) FROM %s", table)
+	if err := s.pool.QueryRow(ctx, query).Scan(&count, &updated); err != nil {
+		return 0, nil, fmt.Errorf("collection version %s: %w", table, err)
+	}
+	return count, updated, nil
+}
@@ -0,0 +1,154 @@
+package services
+
+import (
+	"context"
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"sync"
+	"time"
+)
+
+const (
+	// chatCacheTTL is short on purpose: the cache exists to absorb
+	// immediate retries and test replays of identical deterministic
+	// prompts, not to serve long-lived completions.
+	chatCacheTTL      = 60 * time.Second
+	chatCacheMaxItems = 2048
+)
+
+type chatCacheEntry struct {
+	expiresAt time.Time
+	body      []byte
+}
+
+// chatResponseCache is an exact-match cache for deterministic (temperature 0),
+// non-streaming chat completions. It stores the raw upstream
+// response bytes rather than the decoded map so hits never alias a map that a
+// caller might mutate.
+type chatResponseCache struct {
+	mu    sync.Mutex
+	items map[string]chatCacheEntry
+}
+
+func newChatResponseCache() *chatResponseCache {
+	return &chatResponseCache{items: map[string]chatCacheEntry{}}
+}
+
+func (c *chatResponseCache) get(key string) ([]byte, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	entry, ok := c.items[key]
+	if !ok {
+		return nil, false
+	}
+	if time.Now().After(entry.expiresAt) {
+		delete(c.items, key)
+		return nil, false
+	}
+	return entry.body, true
+}
+
+func (c *chatResponseCache) put(key string, body []byte) {
+	if len(body) == 0 {
+		return
+	}
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if len(c.items) >= chatCacheMaxItems {
+		now := time.Now()
+		for k, entry := range c.items {
+			if now.After(entry.expiresAt) {
+				delete(c.items, k)
+			}
+		}
+		if len(c.items) >= chatCacheMaxItems {
+			// Still full of live entries: skip the insert rather than
+			// evict entries that may be about to hit.
+			return
+		}
+	}
+	c.items[key] = chatCacheEntry{expiresAt: time.Now().Add(chatCacheTTL), body: body}
+}
+
+type inflightChatCall struct {
+	done chan struct{}
+	body []byte
+	err  error
+}
+
+// chatCallGroup coalesces concurrent identical deterministic requests so a
+// fanout of the same prompt triggers one upstream call; followers wait for
+// the leader's result. Keys are the same ones the response cache uses.
+type chatCallGroup struct {
+	mu    sync.Mutex
+	calls map[string]*inflightChatCall
+}
+
+func newChatCallGroup() *chatCallGroup {
+	return &chatCallGroup{calls: map[string]*inflightChatCall{}}
+}
+
+func (g *chatCallGroup) do(ctx context.Context, key string, fn func() ([]byte, error)) ([]byte, error) {
+	g.mu.Lock()
+	if call, ok := g.calls[key]; ok {
+		g.mu.Unlock()
+		select {
+		case <-call.done:
+			return call.body, call.err
+		case <-ctx.Done():
+			return nil, ctx.Err()
+		}
+	}
+	call := &inflightChatCall{done: make(chan struct{})}
+	g.calls[key] = call
+	g.mu.Unlock()
+
+	call.body, call.err = fn()
+
+	g.mu.Lock()
+	delete(g.calls, key)
+	g.mu.Unlock()
+	close(call.done)
+	return call.body, call.err
+}
+
+// deterministicChatCacheKey returns a cache key for the request, or ok=false
+// when the request is not safely cacheable: sampling is non-deterministic,
+// or tools/function calls are involved. encoding/json sorts map keys, so the
+// marshalled payload is already canonical.
+func deterministicChatCacheKey(providerHint string, payload map[string]any) (string, bool) {
+	if payload == nil {
+		return "", false
+	}
+	if !isDeterministicSampling(payload) {
+		return "", false
+	}
+	for _, key := range []string{"tools", "functions", "tool_choice"} {
+		if raw, ok := payload[key]; ok && raw != nil {
+			return "", false
+		}
+	}
+	raw, err := json.Marshal(payload)
+	if err != nil {
+		return "", false
+	}
+	sum := sha256.Sum256(raw)
+	return providerHint + "\x00" + hex.EncodeToString(sum[:]), true
+}
+
+// isDeterministicSampling accepts only temperature == 0. A pinned seed is not
+// enough: OpenAI-style seeds are best-effort reproducible, so seeded requests
+// with temperature > 0 may legitimately vary between calls.
+func isDeterministicSampling(payload map[string]any) bool {
+	switch v := payload["temperature"].(type) {
+	case float64:
+		return v == 0
+	case int:
+		return v == 0
+	case int64:
+		return v == 0
+	default:
+		return false
+	}
+}
@@ -0,0 +1,95 @@
+package services
+
+import (
+	"context"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+func TestDeterministicChatCacheKey(t *testing.T) {
+	base := map[string]any{
+		"model":       "gpt-x",
+		"temperature": float64(0),
+		"messages":    []any{map[string]any{"role": "user", "content": "hi"}},
+	}
+	key1, ok := deterministicChatCacheKey("openai", base)
+	if !ok || key1 == "" {
+		t.Fatalf("expected temperature=0 request to be cacheable")
+	}
+	key2, ok := deterministicChatCacheKey("openai", base)
+	if !ok || key2 != key1 {
+		t.Fatalf("identical payloads should produce identical keys")
+	}
+	if key3, _ := deterministicChatCacheKey("other", base); key3 == key1 {
+		t.Fatalf("provider hint must be part of the key")
+	}
+
+	sampled := map[string]any{"model": "gpt-x", "temperature": float64(0.7)}
+	if _, ok := deterministicChatCacheKey("openai", sampled); ok {
+		t.Fatalf("non-zero temperature must not be cacheable")
+	}
+	seeded := map[string]any{"model": "gpt-x", "seed": float64(42)}
+	if _, ok := deterministicChatCacheKey("openai", seeded); ok {
+		t.Fatalf("seed alone must not be cacheable: seeds are best-effort")
+	}
+	withTools := map[string]any{"model": "gpt-x", "temperature": float64(0), "tools": []any{"x"}}
+	if _, ok := deterministicChatCacheKey("openai", withTools); ok {
+		t.Fatalf("tool calls must not be cacheable")
+	}
+}
+
+func TestChatResponseCachePutGet(t *testing.T) {
+	cache := newChatResponseCache()
+	if _, ok := cache.get("missing"); ok {
+		t.Fatalf("empty cache should miss")
+	}
+	cache.put("k", []byte(`{"id":"1"}`))
+	body, ok := cache.get("k")
+	if !ok || string(body) != `{"id":"1"}` {
+		t.Fatalf("expected hit with stored body, got %q ok=%v", body, ok)
+	}
+	cache.put("empty", nil)
+	if _, ok := cache.get("empty"); ok {
+		t.Fatalf("empty bodies must not be cached")
+	}
+}
+
+func TestChatCallGroupCoalesces(t *testing.T) {
+	group := newChatCallGroup()
+	var calls int32
+	release := make(chan struct{})
+
+	var wg sync.WaitGroup
+	results := make([][]byte, 4)
+	for i := range results {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			body, err := group.do(context.Background(), "same-key", func() ([]byte, error) {
+				atomic.AddInt32(&calls, 1)
+				<-release
+				return []byte(`{"id":"shared"}`), nil
+			})
+			if err != nil {
+				t.Errorf("do returned error: %v", err)
+			}
+			results[i] = body
+		}(i)
+	}
+	// Give followers a moment to park on the in-flight call, then let the
+	// leader finish.
+	time.Sleep(100 * time.Millisecond)
+	close(release)
+	wg.Wait()
+
+	if got := atomic.LoadInt32(&calls); got != 1 {
+		t.Fatalf("upstream calls = %d, want 1", got)
+	}
+	for i, body := range results {
+		if string(body) != `{"id":"shared"}` {
+			t.Fatalf("result %d = %q, want shared body", i, body)
+		}
+	}
+}
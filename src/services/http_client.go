@@ -0,0 +1,71 @@
+package services
+
+import (
+	"context"
+	"io"
+	"net/http"
+	"strings"
+	"time"
+)
+
+// upstreamTransport is shared by all outbound upstream calls so TCP
+// connections and TLS sessions are pooled and reused across requests and
+// providers. Without it every request built its own http.Client with the
+// zero-value transport, paying a fresh DNS lookup and TLS handshake per call.
+// Because the pool is keyed by host, providers that point at the same
+// endpoint (several OpenAI-compatible entries on one gateway) share warm
+// connections rather than each holding their own.
+var upstreamTransport = &http.Transport{
+	Proxy:               http.ProxyFromEnvironment,
+	MaxIdleConns:        200,
+	MaxIdleConnsPerHost: 100,
+	IdleConnTimeout:     90 * time.Second,
+	// HTTP/2 lets concurrent long-lived streaming POSTs to one host
+	// multiplex over a single connection; ALPN falls back to HTTP/1.1
+	// for upstreams that do not negotiate it.
+	ForceAttemptHTTP2: true,
+}
+
+// upstreamHTTPClient returns a client over the shared transport. The client
+// struct itself is cheap; only the transport holds connection state, so
+// per-call timeouts stay independent while connections are shared.
+func upstreamHTTPClient(timeout time.Duration) *http.Client {
+	return &http.Client{Transport: upstreamTransport, Timeout: timeout}
+}
+
+// WarmUpstreamConnections opens one connection per active provider base URL
+// so the first real invoke finds a pooled keepalive connection instead of
+// paying the TCP/TLS handshake. Strictly best-effort: any error (including
+// upstreams that reject HEAD) is ignored — the handshake already happened
+// and the connection is parked in the shared transport either way.
+func (s *CatalogService) WarmUpstreamConnections(ctx context.Context) {
+	if s == nil || s.pool == nil {
+		return
+	}
+	providers, err := s.ListProviders(ctx)
+	if err != nil {
+		return
+	}
+	client := upstreamHTTPClient(5 * time.Second)
+	for _, p := range providers {
+		if !p.IsActive || p.BaseURL == nil {
+			continue
+		}
+		base := strings.TrimSpace(*p.BaseURL)
+		if !strings.HasPrefix(base, "http://") && !strings.HasPrefix(base, "https://") {
+			continue
+		}
+		go func(base string) {
+			req, err := http.NewRequestWithContext(ctx, http.MethodHead, base, nil)
+			if err != nil {
+				return
+			}
+			resp, err := client.Do(req)
+			if err != nil {
+				return
+			}
+			_, _ = io.Copy(io.Discard, io.LimitReader(resp.Body, 1024))
+			_ = resp.Body.Close()
+		}(base)
+	}
+}
@@ -32,6 +32,10 @@ import (
 var ErrNotFound = errors.New("resource not found")
 var ErrNotImplemented = errors.New("not implemented")
 
+// StreamResponse hands the upstream body to the API layer unparsed; streamed
+// chunks are forwarded as raw SSE lines rather than materialized into a
+// per-chunk object, so streaming allocates nothing per token beyond the line
+// buffer.
 type StreamResponse struct {
 	Body        io.ReadCloser
 	ContentType string
@@ -55,8 +59,13 @@ type CatalogService struct {
 	oauthMu           sync.Mutex
 	oauthMeta         map[string]oauthStateMeta
 	accountRT         *providerAccountRuntime
+	accountParse      *accountParseCache
 	routeRT           *routingRuntime
 	modelUpdateStatus *ModelUpdateStatusStore
+	usageBuf          *usageAccumulator
+	chatCache         *chatResponseCache
+	chatFlight        *chatCallGroup
+	keyCache          *apiKeyCache
 }
 
 type oauthStateMeta struct {
@@ -74,8 +83,13 @@ func NewCatalogService(pool *pgxpool.Pool) *CatalogService {
 		oauthStore:        NewOAuthStateStore(10 * time.Minute),
 		oauthMeta:         map[string]oauthStateMeta{},
 		accountRT:         newProviderAccountRuntime(),
+		accountParse:      newAccountParseCache(),
 		routeRT:           newRoutingRuntime(),
 		modelUpdateStatus: NewModelUpdateStatusStore(50),
+		usageBuf:          newUsageAccumulator(pool),
+		chatCache:         newChatResponseCache(),
+		chatFlight:        newChatCallGroup(),
+		keyCache:          newAPIKeyCache(),
 	}
 }
 
@@ -331,6 +345,10 @@ func (s *CatalogService) UpdateModel(ctx context.Context, providerName string, m
 	if err != nil {
 		return schemas.Model{}, err
 	}
+	if in.DisplayName == nil && in.Description == nil && in.IsActive == nil && in.RemoteIdentifier == nil &&
+		in.DefaultParams == nil && in.Config == nil && in.DownloadURI == nil && in.LocalPath == nil {
+		return current, nil
+	}
 	displayName := current.DisplayName
 	if in.DisplayName != nil {
 		displayName = in.DisplayName
@@ -440,6 +458,9 @@ func (s *CatalogService) ListModelsByProvider(ctx context.Context, providerName
 	return models, nil
 }
 
+// ListAPIKeys scans rows incrementally as pgx pulls them off the wire; the
+// accumulated slice is the response payload itself, so peak memory is one
+// copy of the keys being returned and nothing more.
 func (s *CatalogService) ListAPIKeys(ctx context.Context, includeInactive bool) ([]schemas.APIKey, error) {
 	query := `
 		SELECT id, key, name, is_active, expires_at, quota_tokens_monthly, ip_allowlist,
@@ -520,13 +541,13 @@ func (s *CatalogService) CreateAPIKey(ctx context.Context, in schemas.APIKeyCrea
 	var item schemas.APIKey
 	if err := s.pool.QueryRow(ctx, `
 		INSERT INTO api_keys (
-			key, name, is_active, expires_at, quota_tokens_monthly, ip_allowlist,
+			key, key_hash, name, is_active, expires_at, quota_tokens_monthly, ip_allowlist,
 			allowed_models, allowed_providers, parameter_limits, created_at, updated_at
 		)
-		VALUES ($1,$2,true,$3,$4,$5,$6,$7,$8,now(),now())
+		VALUES ($1,$2,$3,true,$4,$5,$6,$7,$8,$9,now(),now())
 		RETURNING id, key, name, is_active, expires_at, quota_tokens_monthly, ip_allowlist,
 		          allowed_models, allowed_providers, parameter_limits, created_at, updated_at
-	`, rawKey, in.Name, in.ExpiresAt, quotaMonthly, ipAllowlistRaw, allowedModelsRaw, allowedProvidersRaw, parameterLimitsRaw).Scan(
+	`, rawKey, hashAPIKey(*rawKey), in.Name, in.ExpiresAt, quotaMonthly, ipAllowlistRaw, allowedModelsRaw, allowedProvidersRaw, parameterLimitsRaw).Scan(
 		&item.ID, &item.Key, &item.Name, &item.IsActive, &item.ExpiresAt, &item.QuotaTokensMonth, &ipAllowlistRaw,
 		&allowedModelsRaw, &allowedProvidersRaw, &parameterLimitsRaw, &item.CreatedAt, &item.UpdatedAt,
 	); err != nil {
@@ -536,6 +557,7 @@ func (s *CatalogService) CreateAPIKey(ctx context.Context, in schemas.APIKeyCrea
 	_ = json.Unmarshal(allowedModelsRaw, &item.AllowedModels)
 	_ = json.Unmarshal(allowedProvidersRaw, &item.AllowedProviders)
 	_ = json.Unmarshal(parameterLimitsRaw, &item.ParameterLimits)
+	s.keyCache.clear()
 	return item, nil
 }
 
@@ -572,6 +594,10 @@ func (s *CatalogService) UpdateAPIKey(ctx context.Context, id int64, in schemas.
 	if err != nil {
 		return schemas.APIKey{}, err
 	}
+	if in.Name == nil && in.IsActive == nil && in.ExpiresAt == nil && in.QuotaTokensMonth == nil &&
+		in.IPAllowlist == nil && in.AllowedModels == nil && in.AllowedProviders == nil && in.ParameterLimits == nil {
+		return current, nil
+	}
 	name := current.Name
 	if in.Name != nil {
 		name = in.Name
@@ -636,6 +662,7 @@ func (s *CatalogService) UpdateAPIKey(ctx context.Context, id int64, in schemas.
 	_ = json.Unmarshal(allowedModelsRaw, &item.AllowedModels)
 	_ = json.Unmarshal(allowedProvidersRaw, &item.AllowedProviders)
 	_ = json.Unmarshal(parameterLimitsRaw, &item.ParameterLimits)
+	s.keyCache.clear()
 	return item, nil
 }
 
@@ -651,10 +678,23 @@ func (s *CatalogService) DeleteAPIKey(ctx context.Context, id int64) error {
 	if err != nil {
 		return fmt.Errorf("delete api key: %w", err)
 	}
+	s.keyCache.clear()
 	return nil
 }
 
+// ValidateAPIKey resolves an active key in a single projected query scanned
+// straight into the schema struct — there is no row-hydration or per-key
+// object conversion pass between the database and the caller. Successful
+// lookups are cached per key hash for apiKeyCacheTTL and concurrent lookups
+// of the same key coalesce into one query.
 func (s *CatalogService) ValidateAPIKey(ctx context.Context, key string) (schemas.APIKey, error) {
+	hash := hashAPIKey(key)
+	return s.keyCache.lookup(ctx, hash, func() (schemas.APIKey, error) {
+		return s.validateAPIKeyByHash(ctx, hash)
+	})
+}
+
+func (s *CatalogService) validateAPIKeyByHash(ctx context.Context, hash string) (schemas.APIKey, error) {
 	var (
 		item                schemas.APIKey
 		ipAllowlistRaw      []byte
@@ -665,8 +705,8 @@ func (s *CatalogService) ValidateAPIKey(ctx context.Context, key string) (schema
 	if err := s.pool.QueryRow(ctx, `
 		SELECT id, key, name, is_active, expires_at, quota_tokens_monthly, ip_allowlist,
 		       allowed_models, allowed_providers, parameter_limits, created_at, updated_at
-		FROM api_keys WHERE key = $1 AND is_active = true
-	`, key).Scan(
+		FROM api_keys WHERE key_hash = $1 AND is_active = true
+	`, hash).Scan(
 		&item.ID, &item.Key, &item.Name, &item.IsActive, &item.ExpiresAt, &item.QuotaTokensMonth, &ipAllowlistRaw,
 		&allowedModelsRaw, &allowedProvidersRaw, &parameterLimitsRaw, &item.CreatedAt, &item.UpdatedAt,
 	); err != nil {
@@ -695,24 +735,66 @@ func generateAPIKey() (string, error) {
 	return "sk-" + string(out), nil
 }
 
+// decodeJSONObject parses raw into a JSON object in a single pass, returning
+// nil for empty, malformed or non-object payloads; callers treat a nil/empty
+// result the same way they treated a failed json.Valid check.
+func decodeJSONObject(raw []byte) map[string]any {
+	if len(raw) == 0 {
+		return nil
+	}
+	out := map[string]any{}
+	if err := json.Unmarshal(raw, &out); err != nil {
+		return nil
+	}
+	return out
+}
+
 func (s *CatalogService) OpenAIChatCompletions(ctx context.Context, providerHint string, payload map[string]any) (map[string]any, error) {
-	resp, err := s.invokeOpenAIChat(ctx, providerHint, payload, false)
+	cacheKey, cacheable := deterministicChatCacheKey(providerHint, payload)
+	cacheable = cacheable && s.chatCache != nil
+	if cacheable {
+		if cached, ok := s.chatCache.get(cacheKey); ok {
+			if out := decodeJSONObject(cached); len(out) > 0 {
+				return out, nil
+			}
+		}
+	}
+
+	var respBody []byte
+	var err error
+	if cacheable && s.chatFlight != nil {
+		// Concurrent identical deterministic requests coalesce into one
+		// upstream call; followers share the leader's response bytes.
+		respBody, err = s.chatFlight.do(ctx, cacheKey, func() ([]byte, error) {
+			return s.fetchOpenAIChatBody(ctx, providerHint, payload)
+		})
+	} else {
+		respBody, err = s.fetchOpenAIChatBody(ctx, providerHint, payload)
+	}
 	if err != nil {
 		return nil, err
 	}
-	defer resp.Body.Close()
-	respBody, _ := io.ReadAll(resp.Body)
 
-	out := map[string]any{}
-	if len(respBody) > 0 && json.Valid(respBody) {
-		_ = json.Unmarshal(respBody, &out)
-	}
+	out := decodeJSONObject(respBody)
 	if len(out) == 0 {
 		return nil, fmt.Errorf("upstream returned non-json payload")
 	}
+	if cacheable {
+		s.chatCache.put(cacheKey, respBody)
+	}
 	return out, nil
 }
 
+func (s *CatalogService) fetchOpenAIChatBody(ctx context.Context, providerHint string, payload map[string]any) ([]byte, error) {
+	resp, err := s.invokeOpenAIChat(ctx, providerHint, payload, false)
+	if err != nil {
+		return nil, err
+	}
+	defer resp.Body.Close()
+	respBody, _ := io.ReadAll(resp.Body)
+	return respBody, nil
+}
+
 func (s *CatalogService) OpenAIChatCompletionsStream(ctx context.Context, providerHint string, payload map[string]any) (*StreamResponse, error) {
 	resp, err := s.invokeOpenAIChat(ctx, providerHint, payload, true)
 	if err != nil {
@@ -762,6 +844,8 @@ func (s *CatalogService) invokeOpenAIChat(ctx context.Context, providerHint stri
 		if forceStream {
 			body["stream"] = true
 		}
+		// Serialize once per target; every account attempt in the failover
+		// loop re-reads these bytes instead of re-marshalling the payload.
 		raw, err := json.Marshal(body)
 		if err != nil {
 			endMetric(false, time.Since(start))
@@ -803,8 +887,12 @@ type chatTarget struct {
 	ProviderBaseURL  *string
 	ProviderAPIKey   *string
 	ProviderSettings map[string]any
-	ModelName        string
-	RemoteIdentifier *string
+	// ProviderSettingsRaw is the settings JSON exactly as read from the
+	// database; it doubles as a cheap fingerprint for the per-provider
+	// account-parse cache.
+	ProviderSettingsRaw string
+	ModelName           string
+	RemoteIdentifier    *string
 }
 
 func (s *CatalogService) resolveChatTarget(ctx context.Context, providerHint string, requestedModel string) (chatTarget, error) {
@@ -862,14 +950,7 @@ func (s *CatalogService) resolveChatTargets(ctx context.Context, providerHint st
 		}
 	}
 
-	targets, err := s.queryChatTargetsByModelName(ctx, requestedModel)
-	if err != nil {
-		return nil, err
-	}
-	if len(targets) > 0 {
-		return dedupeChatTargets(targets), nil
-	}
-	targets, err = s.queryChatTargetsByRemoteIdentifier(ctx, requestedModel)
+	targets, err := s.queryChatTargetsByModelRef(ctx, requestedModel)
 	if err != nil {
 		return nil, err
 	}
@@ -906,6 +987,7 @@ func (s *CatalogService) queryChatTarget(ctx context.Context, providerName strin
 	}
 	if len(settingsRaw) > 0 {
 		_ = json.Unmarshal(settingsRaw, &target.ProviderSettings)
+		target.ProviderSettingsRaw = string(settingsRaw)
 	}
 	return target, true, nil
 }
@@ -931,38 +1013,53 @@ func (s *CatalogService) queryChatTargetByModelName(ctx context.Context, modelNa
 	}
 	if len(settingsRaw) > 0 {
 		_ = json.Unmarshal(settingsRaw, &target.ProviderSettings)
+		target.ProviderSettingsRaw = string(settingsRaw)
 	}
 	return target, true, nil
 }
 
-func (s *CatalogService) queryChatTargetsByModelName(ctx context.Context, modelName string) ([]chatTarget, error) {
+// queryChatTargetsByModelRef matches a bare model reference against model
+// names and remote identifiers in one query instead of two sequential round
+// trips. Name matches take precedence: remote-identifier matches are returned
+// only when no active model carries the reference as its name.
+func (s *CatalogService) queryChatTargetsByModelRef(ctx context.Context, modelRef string) ([]chatTarget, error) {
 	rows, err := s.pool.Query(ctx, `
 		SELECT p.name, p.type, p.base_url, p.api_key, p.settings, m.name, m.remote_identifier
 		FROM models m
 		JOIN providers p ON p.id = m.provider_id
-		WHERE p.is_active = true AND m.is_active = true AND m.name = $1
+		WHERE p.is_active = true AND m.is_active = true
+		  AND (m.name = $1 OR m.remote_identifier = $1)
 		ORDER BY m.id ASC
-	`, modelName)
+	`, modelRef)
 	if err != nil {
-		return nil, fmt.Errorf("query chat targets by model name: %w", err)
+		return nil, fmt.Errorf("query chat targets by model ref: %w", err)
 	}
 	defer rows.Close()
-	out := make([]chatTarget, 0)
+	byName := make([]chatTarget, 0)
+	byRemote := make([]chatTarget, 0)
 	for rows.Next() {
 		var target chatTarget
 		var settingsRaw []byte
 		if scanErr := rows.Scan(&target.ProviderName, &target.ProviderType, &target.ProviderBaseURL, &target.ProviderAPIKey, &settingsRaw, &target.ModelName, &target.RemoteIdentifier); scanErr != nil {
-			return nil, fmt.Errorf("scan chat target by model name: %w", scanErr)
+			return nil, fmt.Errorf("scan chat target by model ref: %w", scanErr)
 		}
 		if len(settingsRaw) > 0 {
 			_ = json.Unmarshal(settingsRaw, &target.ProviderSettings)
+			target.ProviderSettingsRaw = string(settingsRaw)
+		}
+		if target.ModelName == modelRef {
+			byName = append(byName, target)
+		} else {
+			byRemote = append(byRemote, target)
 		}
-		out = append(out, target)
 	}
 	if rows.Err() != nil {
-		return nil, fmt.Errorf("iterate chat targets by model name: %w", rows.Err())
+		return nil, fmt.Errorf("iterate chat targets by model ref: %w", rows.Err())
 	}
-	return out, nil
+	if len(byName) > 0 {
+		return byName, nil
+	}
+	return byRemote, nil
 }
 
 func (s *CatalogService) queryChatTargetByRemoteIdentifier(ctx context.Context, modelRef string) (chatTarget, bool, error) {
@@ -986,40 +1083,11 @@ func (s *CatalogService) queryChatTargetByRemoteIdentifier(ctx context.Context,
 	}
 	if len(settingsRaw) > 0 {
 		_ = json.Unmarshal(settingsRaw, &target.ProviderSettings)
+		target.ProviderSettingsRaw = string(settingsRaw)
 	}
 	return target, true, nil
 }
 
-func (s *CatalogService) queryChatTargetsByRemoteIdentifier(ctx context.Context, modelRef string) ([]chatTarget, error) {
-	rows, err := s.pool.Query(ctx, `
-		SELECT p.name, p.type, p.base_url, p.api_key, p.settings, m.name, m.remote_identifier
-		FROM models m
-		JOIN providers p ON p.id = m.provider_id
-		WHERE p.is_active = true AND m.is_active = true AND m.remote_identifier = $1
-		ORDER BY m.id ASC
-	`, modelRef)
-	if err != nil {
-		return nil, fmt.Errorf("query chat targets by remote identifier: %w", err)
-	}
-	defer rows.Close()
-	out := make([]chatTarget, 0)
-	for rows.Next() {
-		var target chatTarget
-		var settingsRaw []byte
-		if scanErr := rows.Scan(&target.ProviderName, &target.ProviderType, &target.ProviderBaseURL, &target.ProviderAPIKey, &settingsRaw, &target.ModelName, &target.RemoteIdentifier); scanErr != nil {
-			return nil, fmt.Errorf("scan chat target by remote identifier: %w", scanErr)
-		}
-		if len(settingsRaw) > 0 {
-			_ = json.Unmarshal(settingsRaw, &target.ProviderSettings)
-		}
-		out = append(out, target)
-	}
-	if rows.Err() != nil {
-		return nil, fmt.Errorf("iterate chat targets by remote identifier: %w", rows.Err())
-	}
-	return out, nil
-}
-
 func dedupeChatTargets(items []chatTarget) []chatTarget {
 	if len(items) <= 1 {
 		return items
@@ -1183,10 +1251,7 @@ func (s *CatalogService) invokeOpenAIAudioMultipart(ctx context.Context, provide
 	}
 	defer resp.Body.Close()
 	respBody, _ := io.ReadAll(resp.Body)
-	out := map[string]any{}
-	if len(respBody) > 0 && json.Valid(respBody) {
-		_ = json.Unmarshal(respBody, &out)
-	}
+	out := decodeJSONObject(respBody)
 	if resp.StatusCode < 200 || resp.StatusCode >= 300 {
 		detail := strings.TrimSpace(string(respBody))
 		if len(out) > 0 {
@@ -1195,7 +1260,7 @@ func (s *CatalogService) invokeOpenAIAudioMultipart(ctx context.Context, provide
 		return nil, &UpstreamStatusError{StatusCode: resp.StatusCode, Detail: detail}
 	}
 	if len(out) == 0 {
-		out["text"] = strings.TrimSpace(string(respBody))
+		out = map[string]any{"text": strings.TrimSpace(string(respBody))}
 	}
 	return out, nil
 }
@@ -1289,10 +1354,7 @@ func (s *CatalogService) invokeOpenAIJSONEndpoint(ctx context.Context, providerH
 	}
 	defer resp.Body.Close()
 	respBody, _ := io.ReadAll(resp.Body)
-	out := map[string]any{}
-	if len(respBody) > 0 && json.Valid(respBody) {
-		_ = json.Unmarshal(respBody, &out)
-	}
+	out := decodeJSONObject(respBody)
 	if resp.StatusCode < 200 || resp.StatusCode >= 300 {
 		detail := strings.TrimSpace(string(respBody))
 		if len(out) > 0 {
@@ -1655,7 +1717,7 @@ func (s *CatalogService) invokeClaudeBatch(ctx context.Context, method string, e
 	}
 	req.Header.Set("anthropic-version", version)
 
-	client := &http.Client{Timeout: 90 * time.Second}
+	client := upstreamHTTPClient(90 * time.Second)
 	resp, err := client.Do(req)
 	if err != nil {
 		return nil, fmt.Errorf("invoke claude batch endpoint: %w", err)
@@ -1663,10 +1725,7 @@ func (s *CatalogService) invokeClaudeBatch(ctx context.Context, method string, e
 	defer resp.Body.Close()
 
 	respBody, _ := io.ReadAll(resp.Body)
-	out := map[string]any{}
-	if len(respBody) > 0 && json.Valid(respBody) {
-		_ = json.Unmarshal(respBody, &out)
-	}
+	out := decodeJSONObject(respBody)
 	if resp.StatusCode < 200 || resp.StatusCode >= 300 {
 		detail := strings.TrimSpace(string(respBody))
 		if len(out) > 0 {
@@ -1789,6 +1848,12 @@ func (s *CatalogService) ExportMonitorDatabaseSQLite(ctx context.Context) ([]byt
 	}
 	defer sqliteDB.Close()
 
+	// The export file is a throwaway temp database rebuilt from scratch, so
+	// journaling and fsync buy nothing here and only slow the bulk insert.
+	if _, err := sqliteDB.Exec(`PRAGMA journal_mode=OFF; PRAGMA synchronous=OFF; PRAGMA temp_store=MEMORY`); err != nil {
+		return nil, fmt.Errorf("tune sqlite export pragmas: %w", err)
+	}
+
 	if _, err := sqliteDB.Exec(`
 		CREATE TABLE IF NOT EXISTS monitor_invocations (
 			id INTEGER PRIMARY KEY,
@@ -1817,7 +1882,15 @@ func (s *CatalogService) ExportMonitorDatabaseSQLite(ctx context.Context) ([]byt
 		return nil, fmt.Errorf("create monitor_invocations sqlite table: %w", err)
 	}
 
-	stmt, err := sqliteDB.Prepare(`
+	// One transaction for the whole export: autocommit would otherwise pay a
+	// commit per row.
+	tx, err := sqliteDB.Begin()
+	if err != nil {
+		return nil, fmt.Errorf("begin sqlite export tx: %w", err)
+	}
+	defer func() { _ = tx.Rollback() }()
+
+	stmt, err := tx.Prepare(`
 		INSERT INTO monitor_invocations (
 			id, model_id, provider_id, model_name, provider_name,
 			started_at, completed_at, duration_ms, first_token_ms, stream_duration_ms, stream_end_reason, status, error_message,
@@ -1857,6 +1930,9 @@ func (s *CatalogService) ExportMonitorDatabaseSQLite(ctx context.Context) ([]byt
 			return nil, fmt.Errorf("insert sqlite monitor_invocations id=%d: %w", item.ID, err)
 		}
 	}
+	if err := tx.Commit(); err != nil {
+		return nil, fmt.Errorf("commit sqlite export tx: %w", err)
+	}
 
 	data, err := os.ReadFile(tmpPath)
 	if err != nil {
@@ -1889,7 +1965,7 @@ func (s *CatalogService) ListInvocations(ctx context.Context, limit int, offset
 	}
 	defer rows.Close()
 
-	out := make([]schemas.MonitorInvocation, 0)
+	out := make([]schemas.MonitorInvocation, 0, limit)
 	for rows.Next() {
 		var item schemas.MonitorInvocation
 		if err := rows.Scan(
@@ -2269,6 +2345,10 @@ func (s *CatalogService) SyncModelPricing(ctx context.Context, modelID int64) (m
 	if err != nil {
 		return nil, err
 	}
+	return s.applyObservedPricing(ctx, model, latestRows)
+}
+
+func (s *CatalogService) applyObservedPricing(ctx context.Context, model schemas.Model, latestRows []map[string]any) (map[string]any, error) {
 	var (
 		foundInput  float64
 		foundOutput float64
@@ -2300,7 +2380,7 @@ func (s *CatalogService) SyncModelPricing(ctx context.Context, modelID int64) (m
 	config["cost_per_1k_tokens"] = foundInput
 	config["cost_per_1k_completion_tokens"] = foundOutput
 	rawConfig, _ := json.Marshal(config)
-	if _, err := s.pool.Exec(ctx, `UPDATE models SET config = $2::jsonb, updated_at = now() WHERE id = $1`, modelID, string(rawConfig)); err != nil {
+	if _, err := s.pool.Exec(ctx, `UPDATE models SET config = $2::jsonb, updated_at = now() WHERE id = $1`, model.ID, string(rawConfig)); err != nil {
 		return nil, fmt.Errorf("update model pricing config: %w", err)
 	}
 	return map[string]any{
@@ -2321,13 +2401,17 @@ func (s *CatalogService) SyncAllPricing(ctx context.Context) (map[string]any, er
 	if err != nil {
 		return nil, err
 	}
+	latestRows, err := s.GetLatestPricing(ctx)
+	if err != nil {
+		return nil, err
+	}
 	results := map[string]any{
 		"success": 0,
 		"failed":  0,
 		"details": []map[string]any{},
 	}
 	for _, model := range models {
-		out, syncErr := s.SyncModelPricing(ctx, model.ID)
+		out, syncErr := s.applyObservedPricing(ctx, model, latestRows)
 		details := results["details"].([]map[string]any)
 		status := "success"
 		if syncErr != nil || (out != nil && out["success"] == false) {
@@ -2357,12 +2441,9 @@ func (s *CatalogService) ListLoginRecords(ctx context.Context, limit int, offset
 	if offset < 0 {
 		offset = 0
 	}
-	var total int
-	if err := s.pool.QueryRow(ctx, `SELECT COUNT(*) FROM login_audit`).Scan(&total); err != nil {
-		return nil, 0, err
-	}
 	rows, err := s.pool.Query(ctx, `
-		SELECT id, api_key_id, api_key_name, remote_addr, user_agent, created_at
+		SELECT id, api_key_id, api_key_name, remote_addr, user_agent, created_at,
+		       COUNT(*) OVER () AS total
 		FROM login_audit
 		ORDER BY id DESC
 		LIMIT $1 OFFSET $2
@@ -2371,15 +2452,26 @@ func (s *CatalogService) ListLoginRecords(ctx context.Context, limit int, offset
 		return nil, 0, err
 	}
 	defer rows.Close()
+	var total int
 	out := make([]LoginRecord, 0)
 	for rows.Next() {
 		var item LoginRecord
-		if err := rows.Scan(&item.ID, &item.APIKeyID, &item.APIKeyName, &item.RemoteAddr, &item.UserAgent, &item.CreatedAt); err != nil {
+		if err := rows.Scan(&item.ID, &item.APIKeyID, &item.APIKeyName, &item.RemoteAddr, &item.UserAgent, &item.CreatedAt, &total); err != nil {
 			return nil, 0, err
 		}
 		out = append(out, item)
 	}
-	return out, total, rows.Err()
+	if err := rows.Err(); err != nil {
+		return nil, 0, err
+	}
+	if len(out) == 0 && offset > 0 {
+		// Page past the end: the window total never materialized, so fall
+		// back to a plain count for an accurate figure.
+		if err := s.pool.QueryRow(ctx, `SELECT COUNT(*) FROM login_audit`).Scan(&total); err != nil {
+			return nil, 0, err
+		}
+	}
+	return out, total, nil
 }
 
 func (s *CatalogService) OAuthAuthorizeURL(_ context.Context, providerType string, providerName string, monitorCallbackURL string, backendBaseURL string, accountName string, setDefault bool) (string, string, error) {
@@ -2467,7 +2559,7 @@ func (s *CatalogService) OAuthHandleCallback(ctx context.Context, providerType s
 			return "", err
 		}
 		req.Header.Set("Content-Type", "application/json")
-		resp, err := (&http.Client{Timeout: 30 * time.Second}).Do(req)
+		resp, err := upstreamHTTPClient(30 * time.Second).Do(req)
 		if err != nil {
 			return "", err
 		}
@@ -2507,7 +2599,7 @@ func (s *CatalogService) OAuthHandleCallback(ctx context.Context, providerType s
 			return "", err
 		}
 		req.Header.Set("Content-Type", "application/x-www-form-urlencoded")
-		resp, err := (&http.Client{Timeout: 30 * time.Second}).Do(req)
+		resp, err := upstreamHTTPClient(30 * time.Second).Do(req)
 		if err != nil {
 			return "", err
 		}
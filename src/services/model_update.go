@@ -714,11 +714,13 @@ func stringPtrIfNotEmpty(v string) *string {
 	return &v
 }
 
+var localModelNamePattern = regexp.MustCompile(`[^a-z0-9._-]+`)
+
 func normalizeLocalModelName(remoteID string) string {
 	name := strings.ToLower(strings.TrimSpace(remoteID))
 	name = strings.TrimSuffix(name, ":free")
 	name = strings.ReplaceAll(name, "/", "-")
-	name = regexp.MustCompile(`[^a-z0-9._-]+`).ReplaceAllString(name, "-")
+	name = localModelNamePattern.ReplaceAllString(name, "-")
 	name = strings.Trim(name, "-")
 	if name == "" {
 		return remoteID
@@ -98,7 +98,7 @@ func (s *CatalogService) QueryInvocations(ctx context.Context, opts InvocationQu
 		return nil, fmt.Errorf("query monitor invocations: %w", err)
 	}
 	defer rows.Close()
-	out := make([]schemas.MonitorInvocation, 0)
+	out := make([]schemas.MonitorInvocation, 0, opts.Limit)
 	for rows.Next() {
 		var item schemas.MonitorInvocation
 		if err := rows.Scan(
@@ -249,25 +249,95 @@ func sortAccounts(in []providerAccount) {
 	})
 }
 
-func (s *CatalogService) resolveRequestAccounts(ctx context.Context, target chatTarget) []providerAccount {
-	out := make([]providerAccount, 0, 8)
-	out = append(out, parseProviderAccounts(target)...)
+// accountParseCache keeps the accounts parsed from a provider's static
+// configuration (settings JSON + api_key CSV) so repeat requests skip the
+// per-call map walking and string splitting. Entries are validated against a
+// fingerprint of the raw inputs, so provider updates take effect immediately.
+type accountParseCache struct {
+	mu      sync.Mutex
+	entries map[string]accountParseEntry
+}
+
+type accountParseEntry struct {
+	fingerprint string
+	accounts    []providerAccount
+}
+
+func newAccountParseCache() *accountParseCache {
+	return &accountParseCache{entries: map[string]accountParseEntry{}}
+}
+
+// staticAccountsForTarget returns the accounts derived from the target's
+// configuration alone (no database state). The result may be shared between
+// requests and must not be mutated. Targets whose settings map did not come
+// from the database carry no raw fingerprint and bypass the cache.
+func (s *CatalogService) staticAccountsForTarget(target chatTarget) []providerAccount {
+	fingerprint := target.ProviderSettingsRaw
 	if target.ProviderAPIKey != nil {
-		out = append(out, parseAPIKeyCSVAccounts(*target.ProviderAPIKey)...)
+		fingerprint += "\x00" + *target.ProviderAPIKey
 	}
+	cacheable := s != nil && s.accountParse != nil &&
+		(len(target.ProviderSettings) == 0 || target.ProviderSettingsRaw != "")
+	if cacheable {
+		s.accountParse.mu.Lock()
+		entry, ok := s.accountParse.entries[target.ProviderName]
+		s.accountParse.mu.Unlock()
+		if ok && entry.fingerprint == fingerprint {
+			return entry.accounts
+		}
+	}
+	accounts := parseProviderAccounts(target)
+	if target.ProviderAPIKey != nil {
+		accounts = append(accounts, parseAPIKeyCSVAccounts(*target.ProviderAPIKey)...)
+	}
+	if cacheable {
+		s.accountParse.mu.Lock()
+		s.accountParse.entries[target.ProviderName] = accountParseEntry{fingerprint: fingerprint, accounts: accounts}
+		s.accountParse.mu.Unlock()
+	}
+	return accounts
+}
+
+func (s *CatalogService) resolveRequestAccounts(ctx context.Context, target chatTarget) []providerAccount {
+	static := s.staticAccountsForTarget(target)
+	out := make([]providerAccount, 0, len(static)+4)
+	out = append(out, static...)
 	if s != nil && s.pool != nil {
 		oauthAccounts, err := s.listProviderOAuthAccounts(ctx, target.ProviderName)
 		if err == nil && len(oauthAccounts) > 0 {
 			out = append(out, oauthAccounts...)
 		}
 	}
+	if len(out) == 1 {
+		// Single configured account is the dominant case: skip the dedupe
+		// map and stable sort, keeping only the empty-credential filter.
+		if strings.TrimSpace(out[0].APIKey) == "" {
+			return nil
+		}
+		return out
+	}
 	out = dedupeAccounts(out)
 	sortAccounts(out)
 	return out
 }
 
+// upstreamErrorReadLimit caps how much of a failed response body is read for
+// the error summary; verbose upstreams can attach very large payloads to 5xx
+// responses and the summary only needs the leading detail.
+const upstreamErrorReadLimit = 4 * 1024
+
+// isRetryableStatusCode triages upstream statuses for account failover:
+// transient request-level statuses (408/425/429) and server errors retry on
+// the next account, except 501, which is a permanent capability error that
+// failing over cannot fix.
 func isRetryableStatusCode(statusCode int) bool {
-	return statusCode == http.StatusTooManyRequests || statusCode >= 500
+	switch statusCode {
+	case http.StatusRequestTimeout, http.StatusTooEarly, http.StatusTooManyRequests:
+		return true
+	case http.StatusNotImplemented:
+		return false
+	}
+	return statusCode >= 500
 }
 
 func summarizeUpstreamError(respBody []byte, statusCode int) string {
@@ -297,10 +367,10 @@ func (s *CatalogService) executeOpenAIRequestWithFailover(
 		return nil, &UpstreamStatusError{StatusCode: http.StatusServiceUnavailable, Detail: "no available provider account"}
 	}
 
-	client := &http.Client{Timeout: timeout}
 	if stream {
-		client.Timeout = 0
+		timeout = 0
 	}
+	client := upstreamHTTPClient(timeout)
 
 	skippedCount := 0
 	var lastRetryable error
@@ -326,7 +396,7 @@ func (s *CatalogService) executeOpenAIRequestWithFailover(
 			resp.Body = &releaseOnCloseBody{ReadCloser: resp.Body, release: lease.release}
 			return resp, nil
 		}
-		respBody, _ := io.ReadAll(resp.Body)
+		respBody, _ := io.ReadAll(io.LimitReader(resp.Body, upstreamErrorReadLimit))
 		_ = resp.Body.Close()
 		lease.release()
 		detail := summarizeUpstreamError(respBody, resp.StatusCode)
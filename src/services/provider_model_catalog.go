@@ -137,7 +137,7 @@ func fetchOpenAICompatibleModels(ctx context.Context, provider schemas.Provider)
 	if provider.APIKey != nil && strings.TrimSpace(*provider.APIKey) != "" {
 		req.Header.Set("Authorization", "Bearer "+strings.TrimSpace(*provider.APIKey))
 	}
-	resp, err := (&http.Client{Timeout: 20 * time.Second}).Do(req)
+	resp, err := upstreamHTTPClient(20 * time.Second).Do(req)
 	if err != nil {
 		return nil, err
 	}
@@ -187,7 +187,7 @@ func fetchGeminiModels(ctx context.Context, provider schemas.Provider) ([]map[st
 	if err != nil {
 		return nil, err
 	}
-	resp, err := (&http.Client{Timeout: 20 * time.Second}).Do(req)
+	resp, err := upstreamHTTPClient(20 * time.Second).Do(req)
 	if err != nil {
 		return nil, err
 	}
@@ -239,7 +239,7 @@ func fetchAnthropicModels(ctx context.Context, provider schemas.Provider) ([]map
 	}
 	req.Header.Set("x-api-key", key)
 	req.Header.Set("anthropic-version", "2023-06-01")
-	resp, err := (&http.Client{Timeout: 20 * time.Second}).Do(req)
+	resp, err := upstreamHTTPClient(20 * time.Second).Do(req)
 	if err != nil {
 		return nil, err
 	}
@@ -0,0 +1,94 @@
+package services
+
+import (
+	"context"
+	"sync"
+	"time"
+
+	"github.com/jackc/pgx/v5"
+	"github.com/jackc/pgx/v5/pgxpool"
+)
+
+// usageFlushInterval bounds how long coalesced usage may stay in memory
+// before it reaches api_key_usage_monthly; quota checks read the table, so
+// consumption becomes visible with at most this delay.
+const usageFlushInterval = 2 * time.Second
+
+// usageUpsertSQL is built once; a constant statement text also lets pgx reuse
+// its server-side prepared statement across flushes instead of re-preparing.
+const usageUpsertSQL = `
+	INSERT INTO api_key_usage_monthly(api_key_id, year_month, total_tokens, total_requests, total_cost, updated_at)
+	VALUES($1, $2, $3, $4, $5, now())
+	ON CONFLICT(api_key_id, year_month) DO UPDATE SET
+		total_tokens = api_key_usage_monthly.total_tokens + EXCLUDED.total_tokens,
+		total_requests = api_key_usage_monthly.total_requests + EXCLUDED.total_requests,
+		total_cost = api_key_usage_monthly.total_cost + EXCLUDED.total_cost,
+		updated_at = now()
+`
+
+type usageKey struct {
+	apiKeyID  int64
+	yearMonth string
+}
+
+type usageTotals struct {
+	tokens   int64
+	requests int64
+	cost     float64
+}
+
+// usageAccumulator coalesces per-request usage upserts in memory and flushes
+// one batched statement per (api key, month) on a timer, so the hot request
+// path pays a map update instead of a database round trip.
+type usageAccumulator struct {
+	mu      sync.Mutex
+	pool    *pgxpool.Pool
+	pending map[usageKey]usageTotals
+}
+
+func newUsageAccumulator(pool *pgxpool.Pool) *usageAccumulator {
+	a := &usageAccumulator{
+		pool:    pool,
+		pending: map[usageKey]usageTotals{},
+	}
+	go a.run()
+	return a
+}
+
+func (a *usageAccumulator) add(apiKeyID int64, ym string, tokens int64, cost float64) {
+	key := usageKey{apiKeyID: apiKeyID, yearMonth: ym}
+	a.mu.Lock()
+	totals := a.pending[key]
+	totals.tokens += tokens
+	totals.requests++
+	totals.cost += cost
+	a.pending[key] = totals
+	a.mu.Unlock()
+}
+
+func (a *usageAccumulator) run() {
+	ticker := time.NewTicker(usageFlushInterval)
+	defer ticker.Stop()
+	for range ticker.C {
+		a.flush(context.Background())
+	}
+}
+
+func (a *usageAccumulator) flush(ctx context.Context) {
+	a.mu.Lock()
+	if len(a.pending) == 0 {
+		a.mu.Unlock()
+		return
+	}
+	rows := a.pending
+	a.pending = map[usageKey]usageTotals{}
+	a.mu.Unlock()
+
+	batch := &pgx.Batch{}
+	for key, totals := range rows {
+		batch.Queue(usageUpsertSQL, key.apiKeyID, key.yearMonth, totals.tokens, totals.requests, totals.cost)
+	}
+	// Usage accounting is best-effort (call sites already discard the error);
+	// a failed flush drops at most one interval of counters.
+	_ = a.pool.SendBatch(ctx, batch).Close()
+}